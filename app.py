@@ -1,271 +1,326 @@
 import streamlit as st
 import datetime
+import html
 import re
 import time
 import math
-import pandas as pd
-from bs4 import BeautifulSoup
-from io import BytesIO
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from exporter import EXPORT_FORMATS, ICS_PER_ARTICLE, ICS_PER_DAY, int_view, schedule_frame
+from export_jobs import ExportJobs
+from scheduler import build_tasks, capacity_vector, feasibility_frontier, reschedule, schedule, schedule_balanced
+import session_store
+from catalog import ClassCatalog, SharedClass, normalize_name, own_copy
+from perf import PerfLog, widget_count
+from syllabus_cache import cache_key, parse_many, parse_pool
 
 st.set_page_config(page_title="Studico.", layout="wide", page_icon="🎓")
+run_started = time.perf_counter()
 
 # --- CUSTOM CSS ---
-st.markdown("""
-    <style>
-    /* --- TOMBOL UTAMA (Primary) --- */
-    div.stButton > button[kind="primary"]:not(:disabled), 
-    div.stDownloadButton > button[kind="primary"]:not(:disabled) {
-        background-color: #2D3E50; 
-        color: white;
-        border: none;
-    }
-    
-    div.stButton > button[kind="primary"]:not(:disabled):hover, 
-    div.stDownloadButton > button[kind="primary"]:not(:disabled):hover {
-        background-color: #1A2530; 
-        color: white;
-        border: none;
-    }
-    
-    div.stButton > button[kind="primary"]:not(:disabled):focus, 
-    div.stDownloadButton > button[kind="primary"]:not(:disabled):focus {
-        box-shadow: none;
-        color: white;
-    }
-
-    div.stButton > button[kind="primary"]:disabled, 
-    div.stDownloadButton > button[kind="primary"]:disabled {
-        background-color: rgba(45, 62, 80, 0.4); 
-        color: rgba(255, 255, 255, 0.4); 
-        border: 1px solid rgba(255, 255, 255, 0.1); 
-        cursor: not-allowed;
-    }
-
-    /* --- NUMBER INPUT (+/- Buttons) --- */
-    div[data-testid="stNumberInput"] button {
-        color: #2D3E50 !important;
-        border-color: rgba(45, 62, 80, 0.2) !important;
-    }
-    div[data-testid="stNumberInput"] button:hover {
-        border-color: #2D3E50 !important;
-        background-color: rgba(45, 62, 80, 0.05) !important;
-    }
-    div[data-testid="stNumberInput"] button:active,
-    div[data-testid="stNumberInput"] button:focus,
-    div[data-testid="stNumberInput"] button:focus-visible {
-        background-color: #2D3E50 !important;
-        color: white !important;
-        border-color: #2D3E50 !important;
-        box-shadow: none !important;
-        outline: none !important;
-    }
-
-    /* --- TABS CUSTOMIZATION (DEFAULT / LIGHT MODE) --- */
-    div[data-baseweb="tab-highlight"] {
-        background-color: #2D3E50 !important;
-    }
-    button[data-baseweb="tab"][aria-selected="true"] {
-        color: #2D3E50 !important;
-    }
-    button[data-baseweb="tab"]:hover {
-        color: #2D3E50 !important;
-        background-color: transparent !important;
-    }
-    button[data-baseweb="tab"]:focus {
-        outline: none !important;
-    }
-
-    /* --- DARK MODE OVERRIDES --- */
-    @media (prefers-color-scheme: dark) {
-        /* Tabs */
-        div[data-baseweb="tab-highlight"] {
-            background-color: #E2E8F0 !important; 
-        }
-        button[data-baseweb="tab"][aria-selected="true"] {
-            color: #E2E8F0 !important;
-        }
-        button[data-baseweb="tab"]:hover {
-            color: #F8FAFC !important; 
-        }
-
-        /* Number Input (+/- Buttons) - Dark Mode */
-        div[data-testid="stNumberInput"] button {
-            color: #E2E8F0 !important;
-            border-color: rgba(226, 232, 240, 0.2) !important;
-        }
-        div[data-testid="stNumberInput"] button:hover {
-            border-color: #E2E8F0 !important;
-            background-color: rgba(226, 232, 240, 0.1) !important;
-        }
-        div[data-testid="stNumberInput"] button:active,
-        div[data-testid="stNumberInput"] button:focus,
-        div[data-testid="stNumberInput"] button:focus-visible {
-            background-color: #E2E8F0 !important;
-            color: #000000 !important;
-            border-color: #E2E8F0 !important;
-            box-shadow: none !important;
-            outline: none !important;
-        }
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Dibaca & di-minify sekali per proses dari assets/style.css (termasuk keyframes toast),
+# bukan string CSS besar + keyframes baru tiap toast. Tetap dikirim di tiap full rerun
+# (elemen yang gak dirender ulang dihapus Streamlit), tapi fragment rerun gak ikut kirim.
+@st.cache_resource
+def load_css():
+    css = (Path(__file__).parent / "assets" / "style.css").read_text(encoding="utf-8")
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    return "<style>" + " ".join(css.split()) + "</style>"
+
+st.html(load_css())
 
 # --- Helper Function: Custom Toast ---
 def show_custom_toast(message, type="error", duration=5):
+    # Style & animasi ada di assets/style.css; id unik biar elemennya baru & animasinya mulai ulang
     unique_id = int(time.time() * 1000)
-    
-    if type == "error":
-        bg_color = "#FFE9E9" 
-        text_color = "#991B1B" 
-        icon = "⚠️"
-    else:
-        bg_color = "#E8F9EE" 
-        text_color = "#065F46" 
-        icon = "✅"
-    
-    # CSS Animation for fade out
-    html_code = f"""
-    <style>
-        @keyframes slideInDown-{unique_id} {{
-            0% {{ opacity: 0; top: -50px; }}
-            10% {{ opacity: 1; top: 90px; }} 
-            90% {{ opacity: 1; top: 90px; }}
-            100% {{ opacity: 0; top: -50px; pointer-events: none; }}
-        }}
-        .custom-toast-{unique_id} {{
-            position: fixed;
-            right: 20px;
-            top: 90px;
-            background-color: {bg_color};
-            color: {text_color};
-            padding: 12px 24px;
-            border-radius: 8px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            z-index: 999999;
-            font-family: 'Source Sans Pro', sans-serif;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            animation: slideInDown-{unique_id} {duration}s ease-in-out forwards;
-        }}
-    </style>
-    <div class="custom-toast-{unique_id}">
-        <span style="font-size: 1.5rem;">{icon}</span>
-        <div style="font-weight: 500;">{message}</div>
+    kind, icon = ("error", "⚠️") if type == "error" else ("success", "✅")
+    return f"""
+    <div class="custom-toast custom-toast--{kind}" id="toast-{unique_id}" style="animation-duration: {duration}s;">
+        <span class="custom-toast__icon">{icon}</span>
+        <div class="custom-toast__message">{message}</div>
     </div>
     """
-    return html_code
 
-# --- Helper Function: Parser (From HTML Content) ---
-def parse_dicoding_html(html_content):
+# --- Helper Function: Flash Message ---
+# Pengganti time.sleep + st.success: pesan disimpan dulu, lalu tampil sebagai toast
+# di render berikutnya (full rerun atau fragment rerun, mana yang duluan).
+# Pesannya dirender sebagai HTML, jadi teks dari user (nama kelas dll) wajib html.escape().
+def flash(message, type="success", duration=5):
+    st.session_state.flash = (message, type, duration)
+
+def show_flash():
+    if st.session_state.get("flash"):
+        message, toast_type, duration = st.session_state.flash
+        st.session_state.flash = None
+        st.markdown(show_custom_toast(message, type=toast_type, duration=duration), unsafe_allow_html=True)
+
+# --- Helper Function: Kapasitas per Hari ---
+WEEKDAY_NAMES = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu"]
+
+def parse_date_minutes(text):
+    # Format `YYYY-MM-DD [menit]` per baris, tanpa menit = libur (0).
+    # Return (dict tanggal -> menit, baris yang gagal)
+    date_minutes, error_lines = {}, []
+    for line in text.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        try:
+            day = datetime.date.fromisoformat(parts[0])
+            minutes = int(parts[1]) if len(parts) > 1 else 0
+        except ValueError:
+            error_lines.append(line.strip())
+            continue
+        if len(parts) > 2 or minutes < 0:
+            error_lines.append(line.strip())
+            continue
+        date_minutes[day] = minutes
+    return date_minutes, error_lines
+
+# --- Cached Artifacts ---
+# Key = hash jadwal (dihitung sekali saat Generate). File Markdown/Excel/CSV/ICS dibangun
+# & disimpan ExportJobs (lihat Background Export), jadi rerun dari tombol sidebar gak
+# rebuild selama jadwalnya gak berubah. Halaman kalender & DataFrame preview di-cache
+# per key (LRU, max 32 entri); total harian dibaca langsung dari schedule.days() (offset,
+# index task & total menit per hari, dihitung sekali per jadwal) tanpa cache_data, karena
+# cache_data nyimpen hasil dalam bentuk pickle (di-copy tiap hit).
+DAY_STATUS = ["🏖️ Free Day", "🔥 Overload", "✅ On Track"]
+
+# numpy & pandas (plus openpyxl/bs4 di exporter & parser) di-import di bagian yang butuh,
+# jadi halaman kosong pertama kali buka gak nunggu import library berat.
+def day_summaries(plan, minutes_per_day):
+    # View numpy (tanpa copy) ke DayIndex + status tiap hari.
+    # Return (offset hari, index task awal, index task akhir, total menit, index DAY_STATUS)
+    import numpy as np
+    days = plan.days()
+    totals = int_view(days.totals)
+    offsets = int_view(days.offsets)
+    # Target tiap hari: kapasitas custom hari itu kalau ada, selain itu target harian
+    limits = minutes_per_day if plan.capacities is None else int_view(plan.capacities)[offsets]
+    # Index ke DAY_STATUS: 0 = Free Day, 1 = Overload, 2 = On Track
+    status_idx = np.select([totals == 0, totals > limits], [0, 1], default=2)
+    return offsets, int_view(days.starts), int_view(days.ends), totals, status_idx
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_calendar_pages(schedule_key, view, _schedule):
+    # Batas (start, end) offset hari untuk tiap minggu / bulan, dihitung dari tanggal saja
+    pages = []
+    offset = 0
+    while offset < _schedule.total_days:
+        day = _schedule.date(offset)
+        if view == "Week":
+            next_start = day + datetime.timedelta(days=7 - day.weekday())
+        else:
+            next_start = (day.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+        end = min((next_start - _schedule.start).days, _schedule.total_days)
+        pages.append((offset, end))
+        offset = end
+    return pages
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def cached_frame(schedule_key, _schedule):
+    # Read-only, jadi aman dipakai bareng tanpa copy
+    return schedule_frame(_schedule)
+
+# --- Background Export ---
+# File Markdown/Excel/CSV/ICS dibangun di thread pool bersama (lihat export_jobs.py);
+# tab cuma nampilin progress sampai bytes-nya siap, jadi editor tetap bisa dipakai.
+@st.cache_resource
+def export_jobs():
+    return ExportJobs()
+
+# Satu process pool parser per server (ukurannya terbatas), bukan pool baru tiap klik Process File
+@st.cache_resource
+def shared_parse_pool():
+    return parse_pool()
+
+PARSE_CRASHED = "Parser berhenti mendadak (file terlalu besar?). Coba upload lagi."
+
+def parse_uploads(raw_files):
+    # Worker yang mati (mis. kena OOM killer di file raksasa) bikin pool-nya rusak permanen:
+    # pool diganti baru lalu dicoba sekali lagi; kalau masih gagal, dilaporkan per file
+    for _ in range(2):
+        try:
+            return parse_many(raw_files, pool=shared_parse_pool())
+        except BrokenProcessPool:
+            shared_parse_pool().shutdown(wait=False)
+            shared_parse_pool.clear()
+    return [(None, PARSE_CRASHED)] * len(raw_files)
+
+def submit_export(fmt, options=()):
+    return export_jobs().submit(st.session_state.schedule_key, fmt, st.session_state.schedule, options)
+
+@st.fragment(run_every=0.5)
+def export_progress(job, label):
+    # Poll tiap 0.5 detik selama job jalan; begitu selesai, full rerun biar tab
+    # render ulang dengan tombol download (dan polling-nya berhenti)
+    if job.ready:
+        st.rerun()
+    st.progress(job.progress, text=f"⏳ Menyiapkan {label}... {int(job.progress * 100)}%")
+
+def export_result(job, label):
+    # Return bytes kalau job sudah selesai, kalau belum tampilkan progress & return None
+    if not job.ready:
+        export_progress(job, label)
+        return None
+    if job.future.exception():
+        st.error(f"Gagal membuat {label}: {job.future.exception()}", icon="🚫")
+        # Job gagal tetap disimpan (biar error-nya kelihatan), build ulang cuma dari tombol ini
+        if st.button("🔁 Coba lagi", key=f"retry_{label}"):
+            export_jobs().retry(job.key)
+            st.rerun()
+        return None
+    # Durasi build dicatat sekali per job di panel Debug performance
+    seen = st.session_state.setdefault("export_timed", set())
+    if job.key not in seen and job.elapsed is not None:
+        seen.add(job.key)
+        perf.record(f"{job.key[1]}_build", job.elapsed)
+    return job.result()
+
+# --- Shared Class Catalog ---
+# Satu katalog per proses server: kelas yang sama cukup di-parse & disimpan sekali,
+# session cuma pegang referensinya (copy-on-write saat diedit, lihat own_class).
+@st.cache_resource
+def shared_catalog():
+    return ClassCatalog()
+
+def own_class(class_idx):
+    classes = st.session_state.classes
+    if isinstance(classes[class_idx], SharedClass):
+        classes[class_idx] = own_copy(classes[class_idx])
+    return classes[class_idx]
+
+def class_name_index():
+    return {normalize_name(c["name"]) for c in st.session_state.classes}
+
+# --- Helper Function: Persist Plan ---
+# Kelas + jadwal disimpan ke SQLite per plan_id (ada di URL ?plan=...), jadi refresh
+# browser / restart server gak perlu upload & parse ulang file HTML.
+def persist():
+    with st.session_state.perf.stage("persist"):
+        session_store.save(st.session_state.plan_id, st.session_state.classes, st.session_state.schedule)
+
+# --- Helper Function: Live Reschedule ---
+def refresh_schedule():
+    # Jadwal yang sudah ada ikut di-update setelah edit materi, dihitung ulang
+    # mulai dari hari pertama yang kena edit (hari sebelumnya dipakai ulang).
+    if st.session_state.schedule is None:
+        persist()
+        return
+    with st.session_state.perf.stage("reschedule"):
+        result = reschedule(st.session_state.schedule, build_tasks(st.session_state.classes))
+    st.session_state.schedule = result
+    st.session_state.schedule_key = result.fingerprint()
+    persist()
+    # Tab Preview/Markdown/Excel ada di luar fragment editor -> perlu full rerun
+    st.session_state.schedule_dirty = True
+
+# --- Helper Function: Table Editor ---
+ARTICLES_PER_PAGE = 50
+
+def _clean_title(value):
+    return str(value).strip() if value is not None else ""
+
+def _clean_duration(value):
     try:
-        # Proses HTML langsung dari string/file
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Ambil Nama Kelas 
-        class_name_tag = soup.find('h3', class_="mb-3 font-weight-bold")
-        if not class_name_tag:
-            class_name_tag = soup.find('h1')
-            
-        class_name = class_name_tag.get_text(strip=True) if class_name_tag else "Dicoding Class"
-        
-        modules = []
-        
-        # --- LOGIC PARSING ---
-        # Loop tiap syllabus-category (modul)
-        syllabus_categories = soup.select("div.syllabus-category")
-        
-        if not syllabus_categories:
-            return None, "Tidak menemukan elemen silabus. Pastikan file HTML yang diupload benar (Terdapat halaman silabus)."
-
-        for cat in syllabus_categories:
-            modul_title_tag = cat.find("h5", class_="syllabus-category__title")
-            modul_title = modul_title_tag.get_text(strip=True) if modul_title_tag else "Tanpa Modul"
-            
-            current_articles = []
-            
-            for li in cat.select("li"):
-                judul, menit = None, None
-
-                a_tag = li.find("a")
-                p_tag = li.find("p", class_="mb-0 text-secondary")
-
-                if a_tag and p_tag:
-                    judul = a_tag.get_text(strip=True)
-                    menit_text = p_tag.get_text(strip=True)
-                    match = re.search(r'(\d+)', menit_text)
-                    if match:
-                        menit = match.group(1)
-
-                if not judul: 
-                    judul_p = li.find("p", class_="syllabus-module-list__link")
-                    menit_p = li.find("p", class_="mb-0 text-secondary")
-
-                    if judul_p and menit_p:
-                        judul = judul_p.get_text(strip=True)
-                        menit_text = menit_p.get_text(strip=True)
-                        match = re.search(r'(\d+)', menit_text)
-                        if match:
-                            menit = match.group(1)
-
-                # Jika berhasil dapet judul dan menit
-                if judul and menit:
-                    try:
-                        duration_val = int(menit)
-                        current_articles.append({"title": judul, "duration": duration_val})
-                    except ValueError:
-                        pass 
-
-            # Simpan modul kalo ada artikelnya
-            if current_articles:
-                modules.append({"name": modul_title, "articles": current_articles})
-
-        if not modules:
-            return None, "File HTML terbaca, tapi tidak ada modul/artikel yang ditemukan."
-            
-        return {"name": class_name, "modules": modules}, None
-
-    except Exception as e:
-        return None, f"Error parsing file: {str(e)}"
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+def apply_module_edits(editor_key, class_idx):
+    # Terapkan semua perubahan tabel modul sekaligus (rename, hapus, tambah)
+    changes = st.session_state[editor_key]
+    modules = own_class(class_idx)["modules"]
+
+    for row_idx, values in changes["edited_rows"].items():
+        name = _clean_title(values.get("name"))
+        if name:
+            modules[int(row_idx)]["name"] = name
+
+    for row_idx in sorted(changes["deleted_rows"], reverse=True):
+        modules.pop(row_idx)
+
+    existing = {m["name"].strip().lower() for m in modules}
+    for row in changes["added_rows"]:
+        name = _clean_title(row.get("name"))
+        # CEK DUPLIKAT MODUL
+        if name and name.lower() not in existing:
+            existing.add(name.lower())
+            modules.append({"name": name, "articles": []})
+
+    st.session_state.editor_rev += 1
+    refresh_schedule()
+
+def apply_article_edits(editor_key, class_idx, module_idx, offset):
+    # Terapkan perubahan satu halaman tabel artikel sekaligus
+    changes = st.session_state[editor_key]
+    articles = own_class(class_idx)["modules"][module_idx]["articles"]
+    page_len = min(len(articles) - offset, ARTICLES_PER_PAGE)
+
+    for row_idx, values in changes["edited_rows"].items():
+        art = articles[offset + int(row_idx)]
+        if _clean_title(values.get("title", art["title"])):
+            art["title"] = _clean_title(values.get("title", art["title"]))
+        duration = _clean_duration(values.get("duration", art["duration"]))
+        if duration is not None:
+            art["duration"] = duration
+
+    for row_idx in sorted(changes["deleted_rows"], reverse=True):
+        articles.pop(offset + row_idx)
+    page_len -= len(changes["deleted_rows"])
+
+    new_rows = []
+    for row in changes["added_rows"]:
+        title, duration = _clean_title(row.get("title")), _clean_duration(row.get("duration"))
+        if title and duration is not None:
+            new_rows.append({"title": title, "duration": duration})
+    articles[offset + page_len:offset + page_len] = new_rows
+
+    st.session_state.editor_rev += 1
+    refresh_schedule()
 
 # --- Step 0: Initialize session state ---
+if "plan_id" not in st.session_state:
+    # Session baru: ambil plan dari URL kalau ada, kalau nggak bikin plan_id baru
+    st.session_state.plan_id = st.query_params.get("plan") or session_store.new_plan_id()
+    st.query_params["plan"] = st.session_state.plan_id
+    restored = session_store.load(st.session_state.plan_id)
+    if restored:
+        st.session_state.classes, st.session_state.schedule = restored
+        st.session_state.schedule_key = restored[1].fingerprint() if restored[1] else None
 if "classes" not in st.session_state:
     st.session_state.classes = []
 if "schedule" not in st.session_state:
-    st.session_state.schedule = {}
-
-# ========== SIDEBAR ==========
-with st.sidebar:
-    st.write("# ⚙️ Config & Input")
-
-    # --- Step 1: Set Date & Time ---
-    st.markdown("---")
-    st.write("## 1. Set Date & Time")
-    
-    start_date = st.date_input("Start Date", datetime.date.today())
-    end_date = st.date_input("End Date")
+    st.session_state.schedule = None
+if "schedule_key" not in st.session_state:
+    st.session_state.schedule_key = None
+if "editor_rev" not in st.session_state:
+    st.session_state.editor_rev = 0
+if "flash" not in st.session_state:
+    st.session_state.flash = None
+# Timing per stage & jumlah rerun, buat panel Debug performance di sidebar
+if "perf" not in st.session_state:
+    st.session_state.perf = PerfLog()
+perf = st.session_state.perf
+perf.count("full_run")
+# Full rerun sudah render ulang semua tab, jadi flag-nya direset di sini
+st.session_state.schedule_dirty = False
+
+# ========== FRAGMENTS ==========
+# Tiap bagian rerun sendiri-sendiri: edit artikel cuma render ulang editornya,
+# bukan seluruh halaman (Excel, Markdown, Preview).
+@st.fragment
+def material_editor():
+    perf.count_fragment("material_editor")
+    if st.session_state.schedule_dirty:
+        st.rerun()
+    show_flash()
 
-    if end_date < start_date:
-        st.error("End Date tidak boleh lebih awal dari Start Date.", icon="⚠️")
-    
-    st.caption("Target Belajar per Hari:")
-    col_h, col_m = st.columns(2)
-    with col_h:
-        target_hours = st.number_input("Hour(s)", min_value=0, max_value=24, value=3, step=1)
-    with col_m:
-        target_minutes_input = st.number_input("Minute(s)", min_value=0, max_value=59, value=30, step=5)
-        
-    minutes_per_day = (target_hours * 60) + target_minutes_input
-    st.info(f"Target: **{target_hours}h {target_minutes_input}m** / day | **{minutes_per_day}m** / day")
- 
     # --- Step 2: Input Methods ---
     st.markdown("---")
     st.write("## 2. Add Materials")
     
-    input_method = st.radio("Metode Input:", ["📂 Upload HTML File", "✍️ Manual Input"])
+    input_method = st.radio("Metode Input:", ["📂 Upload HTML File", "🗂️ Katalog", "📋 Bulk Import", "✍️ Manual Input"])
     
     # === METHOD A: UPLOAD HTML FILE ===
     if input_method == "📂 Upload HTML File":
@@ -274,44 +329,125 @@ with st.sidebar:
         1. Buka halaman **Detail Kelas** Dicoding di browser.
         *(Contoh: [Memulai Pemrograman dengan Python](https://www.dicoding.com/academies/86))*
         2. **Save As** (Ctrl+S) halaman tersebut sebagai `.html`.
-        3. Upload filenya di sini.
+        3. Upload filenya di sini (bisa beberapa file sekaligus).
         """)
         
-        uploaded_file = st.file_uploader("Upload File Silabus (.html)", type=["html", "htm"])
+        uploaded_files = st.file_uploader("Upload File Silabus (.html)", type=["html", "htm"], accept_multiple_files=True)
         
         if st.button("🚀 Process File", type="primary", use_container_width=True):
-            if uploaded_file is not None:
-                with st.spinner("Sedang membaca file..."):
-                    # Baca konten file
-                    html_content = uploaded_file.getvalue().decode("utf-8")
-                    result, error = parse_dicoding_html(html_content)
+            if uploaded_files:
+                with st.spinner(f"Sedang membaca {len(uploaded_files)} file..."):
+                    # File yang sudah ada di katalog gak perlu di-parse lagi; sisanya di-parse
+                    # sekaligus (paralel, hasil parse di-cache per hash file) lalu masuk katalog
+                    catalog = shared_catalog()
+                    raw_files = [f.getvalue() for f in uploaded_files]
+                    keys = [cache_key(raw) for raw in raw_files]
+                    parsed = [(catalog.get(key), None) for key in keys]
+                    missing = [i for i, (entry, _) in enumerate(parsed) if entry is None]
+                    with perf.stage("parse_html"):
+                        fresh = parse_uploads([raw_files[i] for i in missing])
+                    for i, (result, error) in zip(missing, fresh):
+                        parsed[i] = (catalog.add(keys[i], result) if result else None, error)
                     
-                    if result:
-                        # Cek duplikat kelas
-                        if any(c['name'] == result['name'] for c in st.session_state.classes):
-                             st.warning(f"Kelas '{result['name']}' sudah ada di list.", icon="⚠️")
-                        else:
-                            st.session_state.classes.append(result)
-                            st.success(f"Berhasil menambahkan kelas {result['name']}", icon="✅")
-                            time.sleep(2)
-                            st.rerun()
+                # Cek duplikat kelas (yang sudah ada + sesama file di batch ini)
+                existing_names = class_name_index()
+                report = []
+                for uploaded_file, (result, error) in zip(uploaded_files, parsed):
+                    if not result:
+                        report.append(("error", f"**{uploaded_file.name}**: Gagal memproses file: {error}", "❌"))
+                    elif normalize_name(result['name']) in existing_names:
+                        report.append(("warning", f"**{uploaded_file.name}**: Kelas '{result['name']}' sudah ada di list.", "⚠️"))
                     else:
-                        st.error(f"Gagal memproses file: {error}", icon="❌")
+                        existing_names.add(normalize_name(result['name']))
+                        st.session_state.classes.append(result)
+                        report.append(("success", f"**{uploaded_file.name}**: Berhasil menambahkan kelas {result['name']}", "✅"))
+
+                st.session_state.upload_report = report
+                # Kelas baru -> tombol Generate perlu di-update, jadi rerun seluruh halaman
+                if any(level == "success" for level, _, _ in report):
+                    refresh_schedule()
+                    st.rerun()
             else:
                 st.warning("Upload file HTML dulu yaa.", icon="⚠️")
 
-    # === METHOD B: MANUAL INPUT ===
+        # Laporan per file dari proses terakhir
+        for level, message, icon in st.session_state.pop("upload_report", []):
+            getattr(st, level)(message, icon=icon)
+
+    # === METHOD B: SHARED CATALOG ===
+    elif input_method == "🗂️ Katalog":
+        st.caption("Kelas yang pernah diupload di server ini. Cari nama kelas atau modul.")
+        query = st.text_input("Cari Kelas / Modul", key="catalog_query", placeholder="e.g., Belajar Python")
+        if query.strip():
+            catalog = shared_catalog()
+            found = {key: entry for key, entry in catalog.find_class(query, prefix=True)}
+            found.update((key, entry) for key, entry, _ in catalog.find_module(query, prefix=True))
+            if found:
+                keys = list(found)
+                picked = st.selectbox("Hasil", keys, format_func=lambda k: f"📘 {found[k]['name']} ({len(found[k]['modules'])} modul)", key="catalog_pick")
+                if st.button("➕ Add Class", key="add_from_catalog", use_container_width=True):
+                    if normalize_name(found[picked]["name"]) in class_name_index():
+                        st.warning(f"Kelas '{found[picked]['name']}' sudah ada di list.", icon="⚠️")
+                    else:
+                        st.session_state.classes.append(found[picked])
+                        refresh_schedule()
+                        flash(f"Berhasil menambahkan kelas {html.escape(found[picked]['name'])}")
+                        st.rerun()
+            else:
+                st.caption("*Gak ada yang cocok. Upload file HTML-nya dulu.*")
+
+    # === METHOD C: BULK IMPORT (paste / CSV / XLSX) ===
+    elif input_method == "📋 Bulk Import":
+        st.markdown("""
+        Kolom: **class, module, title, duration** (menit). Header opsional untuk paste,
+        wajib untuk file. Cell class/module kosong ikut baris di atasnya, jadi file Excel
+        hasil export Studico juga bisa diimport ulang.
+        """)
+        pasted = st.text_area("Paste dari Spreadsheet / CSV", key="bulk_paste", height=150,
+                              placeholder="Belajar Python\tPengenalan\tIntro\t5\nBelajar Python\tPengenalan\tSetup\t15")
+        table_file = st.file_uploader("Atau Upload File (.csv / .xlsx)", type=["csv", "xlsx"], key="bulk_file")
+
+        if st.button("📥 Import", type="primary", key="bulk_import_btn", use_container_width=True):
+            from bulk_import import merge_classes, read_file, read_pasted, to_classes, validate
+            try:
+                with perf.stage("bulk_import"):
+                    if table_file is not None:
+                        df = read_file(table_file.name, table_file.getvalue())
+                    elif pasted.strip():
+                        df = read_pasted(pasted)
+                    else:
+                        df = None
+                    if df is not None:
+                        valid, bad_rows = validate(df)
+            except (ValueError, KeyError) as e:
+                st.error(f"Gagal membaca data: {e}", icon="🚫")
+            else:
+                if df is None:
+                    st.warning("Paste data atau upload file dulu yaa.", icon="⚠️")
+                elif bad_rows:
+                    # Semua-atau-tidak: data yang setengah masuk lebih repot dibenerin
+                    st.error(f"**{len(bad_rows)} baris gak valid** (baris {', '.join(map(str, bad_rows[:5]))}{'...' if len(bad_rows) > 5 else ''}). \nPastikan class, module & title terisi dan duration berupa angka ≥ 0.", icon="🚫")
+                elif valid.empty:
+                    st.warning("Gak ada baris yang bisa diimport.", icon="⚠️")
+                else:
+                    added, merged, total = merge_classes(st.session_state.classes, to_classes(valid), own=own_class)
+                    st.session_state.editor_rev += 1
+                    refresh_schedule()
+                    flash(f"Berhasil import {total} artikel ({added} kelas baru, {merged} kelas digabung)")
+                    st.rerun()
+
+    # === METHOD D: MANUAL INPUT ===
     else:
         # Input Class
         class_input = st.text_input("Enter Class Name", key="class_input_man", placeholder="e.g., Belajar Python Dasar")
         if st.button("➕ Add Class", key="save_class_man", use_container_width=True):
             if class_input.strip():
-                if any(c['name'].lower() == class_input.strip().lower() for c in st.session_state.classes):
+                if normalize_name(class_input) in class_name_index():
                     st.warning(f"Kelas '{class_input.strip()}' sudah ada di list.", icon="⚠️")
                 else:
                     st.session_state.classes.append({"name": class_input.strip(), "modules": []})
-                    st.success(f"Berhasil menambahkan kelas {class_input.strip()}", icon="✅")
-                    time.sleep(2)
+                    persist()
+                    flash(f"Berhasil menambahkan kelas {html.escape(class_input.strip())}")
                     st.rerun()
             else:
                 st.warning("Nama kelas tidak boleh kosong.", icon="⚠️")
@@ -322,212 +458,263 @@ with st.sidebar:
     if not st.session_state.classes:
         st.caption("*Belum ada kelas. Tambahkan file HTML atau Manual Input.*")
 
-    # Loop classes untuk manage Modules/Articles
-    for class_idx, class_item in enumerate(st.session_state.classes):
-        with st.expander(f"📘 {class_item['name']}", expanded=False):
-            # Tombol Hapus Kelas
-            if st.button(f"🗑️ Delete Class", key=f"del_class_{class_idx}"):
-                st.session_state.classes.pop(class_idx)
-                st.rerun()
-
-            st.markdown("#### Modules")
+    # Editor: satu kelas & satu modul aktif, artikel di tabel ber-halaman,
+    # jadi jumlah widget tetap walau silabusnya ratusan artikel.
+    if st.session_state.classes:
+        import pandas as pd
+        classes = st.session_state.classes
+        if st.session_state.get("editor_class", 0) >= len(classes):
+            st.session_state.editor_class = 0
+        class_idx = st.selectbox("Class", range(len(classes)), format_func=lambda i: f"📘 {classes[i]['name']}", key="editor_class")
+        class_item = classes[class_idx]
+
+        # Tombol Hapus Kelas
+        if st.button(f"🗑️ Delete Class", key="del_class"):
+            removed = classes.pop(class_idx)
+            st.session_state.editor_rev += 1
+            refresh_schedule()
+            flash(f"Kelas {html.escape(removed['name'])} dihapus")
+            st.rerun()
+
+        st.markdown("#### Modules")
+        st.caption("Edit nama, tambah baris baru, atau hapus modul langsung di tabel.")
+        mod_editor_key = f"mod_editor_{class_idx}_{st.session_state.editor_rev}"
+        st.data_editor(
+            pd.DataFrame(
+                [{"name": m["name"], "articles": len(m["articles"])} for m in class_item["modules"]],
+                columns=["name", "articles"],
+            ),
+            key=mod_editor_key,
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "name": st.column_config.TextColumn("Module", required=True),
+                "articles": st.column_config.NumberColumn("Articles", disabled=True),
+            },
+            on_change=apply_module_edits,
+            args=(mod_editor_key, class_idx),
+        )
+
+        if class_item["modules"]:
+            modules = class_item["modules"]
+            if st.session_state.get("editor_module", 0) >= len(modules):
+                st.session_state.editor_module = 0
+            module_idx = st.selectbox("Module", range(len(modules)), format_func=lambda i: f"📂 {modules[i]['name']}", key="editor_module")
+            module_item = modules[module_idx]
+
+            # Input artikel manual (Bulk)
+            input_val = st.text_area(
+                f"Add Articles (Format: `Judul [spasi] Menit`)",
+                value="",
+                placeholder="Pengantar 5\nInstalasi Tools 15",
+                key=f"area_{class_idx}_{module_idx}",
+                height=68
+            )
             
-            # Form tambah modul manual
-            with st.form(key=f"add_mod_form_{class_idx}"):
-                c1, c2 = st.columns([3, 1])
-                with c1:
-                    new_mod_name = st.text_input("Enter Module Name", placeholder="e.g., Persiapan Belajar")
-                with c2:
-                    st.text("") # spacer
-                    st.text("") 
-                    add_mod_btn = st.form_submit_button("➕ Add")
+            add_clicked = st.button("Add to List", key="btn_add_art")
+            
+            # Logic Add Article 
+            if add_clicked:
+                from bulk_import import parse_article_lines
+                lines_to_add, error_lines = parse_article_lines(input_val)
                 
-                if add_mod_btn and new_mod_name:
-                    # CEK DUPLIKAT MODUL
-                    if any(m['name'].strip().lower() == new_mod_name.strip().lower() for m in class_item["modules"]):
-                        st.warning(f"Modul '{new_mod_name}' sudah ada di list.", icon="⚠️")
-                    else:
-                        class_item["modules"].append({"name": new_mod_name, "articles": []})
-                        st.success(f"Berhasil menambahkan modul {new_mod_name}", icon="✅")
-                        time.sleep(1)
+                if error_lines:
+                    # Tampilkan error jika ada format salah 
+                    st.error(f"**Format salah: `{', '.join(error_lines[:3])}{'...' if len(error_lines)>3 else ''}`.** \nPastikan formatnya: `Judul [spasi] Menit` (contoh: `Pengenalan Dasar 10`)", icon="🚫")
+                elif lines_to_add:
+                    module_item = own_class(class_idx)["modules"][module_idx]
+                    module_item["articles"].extend(lines_to_add)
+                    st.session_state.editor_rev += 1
+                    refresh_schedule()
+                    if st.session_state.schedule_dirty:
+                        # Jadwal ikut berubah -> tab output perlu render ulang
+                        flash("Berhasil menambahkan artikel!")
                         st.rerun()
-
-            # Loop Modules
-            for module_idx, module_item in enumerate(class_item["modules"]):
-                with st.expander(f"📂 {module_item['name']}", expanded=False):
-                    # Tombol Delete Module
-                    if st.button(f"🗑️ Delete Module", key=f"del_mod_{class_idx}_{module_idx}"):
-                        class_item["modules"].pop(module_idx)
-                        st.rerun()
-
-                    # Input artikel manual (Bulk)
-                    input_val = st.text_area(
-                        f"Add Articles (Format: `Judul [spasi] Menit`)",
-                        value="",
-                        placeholder="Pengantar 5\nInstalasi Tools 15",
-                        key=f"area_{class_idx}_{module_idx}",
-                        height=68
-                    )
-                    
-                    col_act1, col_act2 = st.columns(2)
-                    with col_act1:
-                        add_clicked = st.button("Add to List", key=f"btn_add_art_{class_idx}_{module_idx}")
-                    
-                    # Logic Add Article 
-                    if add_clicked:
-                        lines_to_add = []
-                        error_lines = []
-                        
-                        for line in input_val.splitlines():
-                            if not line.strip(): continue 
-                            
-                            match = re.match(r"(.+?)\s+(\d+)$", line.strip())
-                            if match:
-                                t, d = match.groups()
-                                lines_to_add.append({"title": t.strip(), "duration": int(d)})
-                            else:
-                                error_lines.append(line)
-                        
-                        if error_lines:
-                            # Tampilkan error jika ada format salah 
-                            st.error(f"**Format salah: `{', '.join(error_lines[:3])}{'...' if len(error_lines)>3 else ''}`.** \nPastikan formatnya: `Judul [spasi] Menit` (contoh: `Pengenalan Dasar 10`)", icon="🚫")
-                        elif lines_to_add:
-                            module_item["articles"].extend(lines_to_add)
-                            st.success("Berhasil menambahkan artikel!", icon="✅")
-                            time.sleep(1)
-                            st.rerun()
-                    
-                    # List Artikel yang sudah ada
-                    if module_item["articles"]:
-                        for art_idx, art in enumerate(module_item["articles"]):
-                            c_text, c_del = st.columns([4, 1])
-                            with c_text:
-                                st.caption(f"• {art['title']} ({art['duration']}m)")
-                            with c_del:
-                                if st.button("❌", key=f"del_art_{class_idx}_{module_idx}_{art_idx}"):
-                                    module_item["articles"].pop(art_idx)
-                                    st.rerun()
-                    else:
-                        st.caption("*Belum ada artikel*")
-
+                    # Tabel artikel di bawah langsung pakai data baru, gak perlu rerun
+                    st.markdown(show_custom_toast("Berhasil menambahkan artikel!", type="success"), unsafe_allow_html=True)
+            
+            # List Artikel (per halaman)
+            articles = module_item["articles"]
+            total_pages = max(math.ceil(len(articles) / ARTICLES_PER_PAGE), 1)
+            page = 1
+            if total_pages > 1:
+                page = st.number_input(f"Page (1-{total_pages})", min_value=1, max_value=total_pages, value=1, step=1, key=f"art_page_{class_idx}_{module_idx}")
+            offset = (page - 1) * ARTICLES_PER_PAGE
+
+            art_editor_key = f"art_editor_{class_idx}_{module_idx}_{page}_{st.session_state.editor_rev}"
+            st.data_editor(
+                pd.DataFrame(articles[offset:offset + ARTICLES_PER_PAGE], columns=["title", "duration"]),
+                key=art_editor_key,
+                num_rows="dynamic",
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "title": st.column_config.TextColumn("Article", required=True),
+                    "duration": st.column_config.NumberColumn("Minutes", min_value=0, step=1, required=True),
+                },
+                on_change=apply_article_edits,
+                args=(art_editor_key, class_idx, module_idx, offset),
+            )
+            st.caption(f"{len(articles)} artikel · {sum(a['duration'] for a in articles)} menit")
+        else:
+            st.caption("*Belum ada modul*")
+
+def show_frontier(frontier):
+    def fmt_date(day):
+        return day.strftime("%d %b %Y") if day else "> 10 tahun"
+
+    with st.expander("🧭 Alternatif Jadwal", expanded=True):
+        st.caption("Tambah target harian -> selesai paling cepat:")
+        st.dataframe(
+            [{"Target / Hari": f"{minutes} min", "Selesai": fmt_date(day)} for minutes, day in frontier.by_target],
+            hide_index=True, use_container_width=True,
+        )
+        st.caption("Perpanjang End Date -> target harian minimal:")
+        st.dataframe(
+            [{"End Date": fmt_date(day), "Target / Hari": f"{minutes} min" if minutes else "-"} for day, minutes in frontier.by_end],
+            hide_index=True, use_container_width=True,
+        )
+
+@st.fragment
+def generate_step(start_date, end_date, minutes_per_day, weekday_minutes=None, date_minutes=None):
+    perf.count_fragment("generate_step")
     # --- Step 3: Generate Schedule ---
     st.markdown("---")
     st.write("## 3. Generate")
     
+    capacities = None
+    if end_date >= start_date and (date_minutes or any(m is not None for m in weekday_minutes or [])):
+        capacities = capacity_vector(
+            start_date, (end_date - start_date).days + 1, minutes_per_day, weekday_minutes, date_minutes,
+        )
+
     can_generate = (
         end_date >= start_date and 
         st.session_state.classes and 
-        minutes_per_day > 0
+        (minutes_per_day if capacities is None else max(capacities, default=0)) > 0
+    )
+    
+    schedule_mode = st.radio(
+        "Mode Jadwal:",
+        ["⚡ Greedy", "⚖️ Balanced"],
+        captions=["Isi tiap hari sampai target harian.", "Ratakan beban ke semua hari, urutan tetap."],
+        key="schedule_mode",
     )
     
     if st.button("📅 Generate Schedule", type="primary", disabled=not can_generate, use_container_width=True):
-        all_tasks = []
-        for class_item in st.session_state.classes:
-            for module_item in class_item["modules"]:
-                for article in module_item["articles"]:
-                    all_tasks.append({
-                        "class": class_item["name"],
-                        "module": module_item["name"],
-                        "title": article["title"],
-                        "duration": article["duration"]
-                    })
-
-        total_days = (end_date - start_date).days + 1
-        schedule = {start_date + datetime.timedelta(days=i): [] for i in range(total_days)}
-
-        current_day = start_date
-        used_minutes = 0
-
-        # Greedy Algorithm
-        task_idx = 0
-        total_tasks = len(all_tasks)
-        
-        while task_idx < total_tasks and current_day <= end_date:
-            task = all_tasks[task_idx]
-            
-            remaining_space = minutes_per_day - used_minutes
-            
-            if task["duration"] <= remaining_space:
-                schedule[current_day].append(task)
-                used_minutes += task["duration"]
-                task_idx += 1
+        with perf.stage("generate_schedule"):
+            all_tasks = build_tasks(st.session_state.classes)
+            if schedule_mode == "⚖️ Balanced":
+                result = schedule_balanced(all_tasks, start_date, end_date, capacities)
             else:
-                if used_minutes == 0:
-                    schedule[current_day].append(task)
-                    current_day += datetime.timedelta(days=1)
-                    used_minutes = 0
-                    task_idx += 1
-                else:
-                    current_day += datetime.timedelta(days=1)
-                    used_minutes = 0
-        
-        if task_idx < total_tasks:
-            msg = "<b>Waktunya gak cukup nih.</b> <br><span style='font-size: 0.9em; opacity: 0.9;'>Coba perpanjang End Date atau tambah durasi belajar, lalu generate ulang.</span>"
-            st.markdown(show_custom_toast(msg, type="error", duration=10), unsafe_allow_html=True)
+                result = schedule(all_tasks, start_date, end_date, minutes_per_day, capacities)
+
+        # Waktunya gak cukup -> hitung alternatif target / End Date sekalian
+        frontier = None
+        over_target = schedule_mode == "⚖️ Balanced" and result.minutes_per_day > minutes_per_day
+        if over_target or not result.is_complete:
+            with perf.stage("feasibility_frontier"):
+                frontier = feasibility_frontier(all_tasks, start_date, end_date, minutes_per_day, weekday_minutes, date_minutes)
+
+        if schedule_mode == "⚖️ Balanced":
+            # Balanced selalu muat; yang dilaporkan target harian paling ketat
+            if over_target:
+                msg = f"<b>Beban harian minimal {result.minutes_per_day} min.</b> <br><span style='font-size: 0.9em; opacity: 0.9;'>Lebih dari target {minutes_per_day} min/hari. Coba perpanjang End Date.</span>"
+                flash(msg, type="error", duration=10)
+            else:
+                flash(f"Jadwal Berhasil Dibuat! Beban maks {result.minutes_per_day} min/hari")
+        elif not result.is_complete:
+            hint = "Coba perpanjang End Date atau tambah durasi belajar."
+            if frontier.min_minutes:
+                hint = f"Butuh minimal {frontier.min_minutes} min/hari sampai End Date"
+                if frontier.earliest_end:
+                    hint += f", atau selesai {frontier.earliest_end.strftime('%d %b %Y')} dengan target sekarang"
+                hint += ". Lihat alternatif di bawah."
+            msg = f"<b>Waktunya gak cukup nih.</b> <br><span style='font-size: 0.9em; opacity: 0.9;'>{hint}</span>"
+            flash(msg, type="error", duration=10)
         else:
-            st.markdown(show_custom_toast("Jadwal Berhasil Dibuat!", type="success", duration=5), unsafe_allow_html=True)
+            flash("Jadwal Berhasil Dibuat!")
+
+        st.session_state.schedule = result
+        st.session_state.schedule_key = result.fingerprint()
+        st.session_state.frontier = (st.session_state.schedule_key, frontier)
+        persist()
+        # Jadwal baru -> semua tab perlu render ulang
+        st.rerun()
 
-        st.session_state.schedule = schedule
+    # Alternatif dari Generate terakhir, selama jadwalnya belum berubah
+    frontier_key, frontier = st.session_state.get("frontier") or (None, None)
+    if frontier is not None and frontier_key == st.session_state.schedule_key:
+        show_frontier(frontier)
 
     st.markdown("---")
     
     # Tombol Reset sekarang menghapus Schedule DAN Classes
     if st.button("🔄 Reset All Data", use_container_width=True):
-        st.session_state.schedule = {}
+        st.session_state.schedule = None
+        st.session_state.schedule_key = None
         st.session_state.classes = []
+        st.session_state.frontier = None
+        session_store.delete(st.session_state.plan_id)
         st.rerun()
 
-
-# ========== MAIN CONTENT ==========
-st.title("Studico.")
-st.markdown(f"##### Set your Dicoding study schedule automatically.")
-
-tab1, tab2, tab3 = st.tabs(["🗓️ Preview", "📝 Markdown", "📥 Excel"])
-
-# Preview
-with tab1:
-    if st.session_state.schedule:
-        total_items = sum(len(v) for v in st.session_state.schedule.values())
-        st.metric("Total Item Dijadwalkan", total_items)
+@st.fragment
+def preview_tab(start_date, minutes_per_day):
+    perf.count_fragment("preview_tab")
+    with perf.stage("preview_render"):
+        if st.session_state.schedule:
+            import numpy as np
+            plan = st.session_state.schedule
+            tasks = plan.tasks
+            day_offsets, day_starts, day_ends, totals, status_idx = day_summaries(plan, minutes_per_day)
         
-        for day, tasks in st.session_state.schedule.items():
-            total_minutes = sum(t["duration"] for t in tasks)
-            total_hours = total_minutes / 60
-            
-            if total_minutes == 0:
-                card_color = "grey"
-                status = "🏖️ Free Day"
-            elif total_minutes > minutes_per_day:
-                card_color = "red" 
-                status = "🔥 Overload"
-            else:
-                card_color = "green"
-                status = "✅ On Track"
+            col_m1, col_m2, col_m3 = st.columns(3)
+            col_m1.metric("Total Item Dijadwalkan", plan.scheduled)
+            col_m2.metric("🔥 Overload Days", int(np.count_nonzero(status_idx == 1)))
+            col_m3.metric("🏖️ Free Days", plan.total_days - len(day_offsets) + int(np.count_nonzero(status_idx == 0)))
+
+            # Cuma hari di minggu/bulan yang dipilih yang dirender
+            view = st.radio("View", ["Week", "Month"], horizontal=True, key="preview_view")
+            pages = cached_calendar_pages(st.session_state.schedule_key, view, plan)
+            if not pages:
+                return
+
+            def page_label(i):
+                page_start, page_end = pages[i]
+                lo, hi = np.searchsorted(day_offsets, [page_start, page_end])
+                return (
+                    f"{plan.date(page_start).strftime('%d %b')} - {plan.date(page_end - 1).strftime('%d %b %Y')}"
+                    f" | {int(totals[lo:hi].sum())} min"
+                )
 
-            with st.expander(f"{day.strftime('%A, %d %b %Y')} | {status} ({total_minutes} min)", expanded=(day == start_date)):
-                if tasks:
-                    for t in tasks:
-                        st.markdown(f"- **{t['class']}** / *{t['module']}* / {t['title']} `({t['duration']} min)`")
-                else:
-                    st.write("Istirahat dulu bro..")
-    else:
-        st.info("👈 Set date & time, add materials, dan generate schedule dulu di sidebar.")
+            page_idx = st.selectbox("Periode", range(len(pages)), format_func=page_label, key=f"preview_page_{view}")
+            page_start, page_end = pages[min(page_idx, len(pages) - 1)]
+            lo, hi = np.searchsorted(day_offsets, [page_start, page_end])
+            visible = {int(day_offsets[k]): k for k in range(lo, hi)}
+
+            for offset in range(page_start, page_end):
+                day = plan.date(offset)
+                k = visible.get(offset)
+                total_minutes = int(totals[k]) if k is not None else 0
+                status = DAY_STATUS[status_idx[k]] if k is not None else DAY_STATUS[0]
+                with st.expander(f"{day.strftime('%A, %d %b %Y')} | {status} ({total_minutes} min)", expanded=(day == start_date)):
+                    if k is not None:
+                        for idx in range(day_starts[k], day_ends[k]):
+                            st.markdown(f"- **{tasks.class_of(idx)}** / *{tasks.module_of(idx)}* / {tasks.titles[idx]} `({tasks.durations[idx]} min)`")
+                    else:
+                        st.write("Istirahat dulu bro..")
+        else:
+            st.info("👈 Set date & time, add materials, dan generate schedule dulu di sidebar.")
 
-# Markdown
-with tab2:
+@st.fragment
+def markdown_tab(start_date):
+    perf.count_fragment("markdown_tab")
     if st.session_state.schedule:
-        markdown_text = ""
-        
-        for day, tasks in st.session_state.schedule.items():
-            total_minutes = sum(t["duration"] for t in tasks)
-            if tasks: 
-                date_str = day.strftime('%A, %d %B %Y')
-                markdown_text += f"- 📅 **{date_str}** (Target: {total_minutes} min)\n"
-                
-                for t in tasks:
-                    markdown_text += f"    - [ ] **{t['class']}** | *{t['module']}* | {t['title']} ({t['duration']}m)\n"
-                
-                markdown_text += "\n"
+        markdown_data = export_result(submit_export("markdown"), "Markdown")
+        if markdown_data is None:
+            return
+        markdown_text = markdown_data.decode("utf-8")
 
         col1, col2 = st.columns([5, 2])
         with col1:
@@ -547,107 +734,117 @@ with tab2:
     else:
         st.info("👈 Generate schedule dulu yaa.")
 
-# Excel
-with tab3:
+@st.fragment
+def excel_tab(start_date):
+    perf.count_fragment("excel_tab")
     if st.session_state.schedule:
         # --- Export Excel ---
-        export_data = []
-        for day, tasks in st.session_state.schedule.items():
-            total_minutes_day = sum(t["duration"] for t in tasks) if tasks else 0
-            
-            if tasks:
-                for t in tasks:
-                    export_data.append({
-                        "Date": day.strftime("%d-%m-%Y"),
-                        "Class": t["class"],
-                        "Module": t["module"],
-                        "Article": t["title"],
-                        "Duration (min)": t["duration"],
-                        "Total Duration (min/day)": total_minutes_day,
-                        "Status (✅)": "☐"
-                    })
-
-        df_export = pd.DataFrame(export_data)
+        with perf.stage("excel_preview"):
+            df_export = cached_frame(st.session_state.schedule_key, st.session_state.schedule)
         
         if not df_export.empty:
-            # --- Save as Excel ---
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine="openpyxl") as writer:
-                df_export.to_excel(writer, index=False, sheet_name="Schedule")
-            output.seek(0)
-
-            wb = load_workbook(output)
-            ws = wb["Schedule"]
-
-            thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                 top=Side(style='thin'), bottom=Side(style='thin'))
-
-            def merge_column_in_rows(ws, col_letter, start_row, end_row):
-                if end_row > start_row:
-                    ws.merge_cells(f"{col_letter}{start_row}:{col_letter}{end_row}")
-                    ws[f"{col_letter}{start_row}"].alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-            def merge_column(ws, col_letter, start_row, end_row):
-                row = start_row
-                while row <= end_row:
-                    merge_start = row
-                    while row + 1 <= end_row and ws[f"{col_letter}{row}"].value == ws[f"{col_letter}{row+1}"].value:
-                        row += 1
-                    merge_column_in_rows(ws, col_letter, merge_start, row)
-                    row += 1
-
-            current_row = 2
-            while current_row <= ws.max_row:
-                date_value = ws[f"A{current_row}"].value
-                start_row = current_row
-                while current_row + 1 <= ws.max_row and ws[f"A{current_row+1}"].value == date_value:
-                    current_row += 1
-                end_row = current_row
-
-                # A=Date, B=Class, C=Module, D=Article, E=Duration, F=Total, G=Status
-                merge_column_in_rows(ws, "A", start_row, end_row) # Merge Date
-                merge_column(ws, "B", start_row, end_row)         # Merge Class
-                merge_column(ws, "C", start_row, end_row)         # Merge Module
-                merge_column_in_rows(ws, "F", start_row, end_row) # Merge Total Duration
-
-                current_row += 1
-
-            # Apply border + alignment + wrap_text
-            for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-                for cell in row:
-                    cell.border = thin_border
-                    col_letter = get_column_letter(cell.column)
-                    if col_letter == "D" and cell.row != 1: 
-                        cell.alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
-                    else:
-                        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-            output_merged = BytesIO()
-            wb.save(output_merged)
-            excel_data = output_merged.getvalue()
-
             # --- button download ---
             col1, col2 = st.columns([5, 2])
             with col1:
                 st.subheader("Preview Excel Table")
                 st.caption("Download file excel melalui tombol di samping.")
             with col2:
-                st.download_button(
-                    label="📥 Download Excel",
-                    data=excel_data,
-                    file_name=f"Studico._{start_date}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    type="primary"
-                )
+                excel_data = export_result(submit_export("xlsx"), "Excel")
+                if excel_data is not None:
+                    st.download_button(
+                        label="📥 Download Excel",
+                        data=excel_data,
+                        file_name=f"Studico._{start_date}.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        type="primary"
+                    )
 
             # --- Preview table ---
             st.dataframe(df_export, use_container_width=True)
+
+            # --- Format lain: CSV & Kalender (.ics) ---
+            st.subheader("Export Lain")
+            ics_mode = st.radio("Event Kalender:", ["Per Hari", "Per Artikel"], horizontal=True, key="ics_mode",
+                                help="Per Artikel: event berurutan mulai jam 08:00.")
+            ics_options = (("per", ICS_PER_DAY if ics_mode == "Per Hari" else ICS_PER_ARTICLE),)
+            col_csv, col_ics = st.columns(2)
+            for col, fmt, label, options in ((col_csv, "csv", "📥 Download CSV", ()), (col_ics, "ics", "📅 Download Calendar (.ics)", ics_options)):
+                _, extension, mime = EXPORT_FORMATS[fmt]
+                with col:
+                    data = export_result(submit_export(fmt, options), fmt.upper())
+                    if data is not None:
+                        st.download_button(label=label, data=data, file_name=f"Studico_{start_date}.{extension}", mime=mime, use_container_width=True)
         else:
             st.warning("Jadwal kosong atau belum digenerate.")
 
     else:
         st.info("👈 Generate schedule dulu yaa.")
 
+# ========== SIDEBAR ==========
+with st.sidebar:
+    st.write("# ⚙️ Config & Input")
+
+    # --- Step 1: Set Date & Time ---
+    st.markdown("---")
+    st.write("## 1. Set Date & Time")
+    
+    start_date = st.date_input("Start Date", datetime.date.today())
+    end_date = st.date_input("End Date")
+
+    if end_date < start_date:
+        st.error("End Date tidak boleh lebih awal dari Start Date.", icon="⚠️")
+    
+    st.caption("Target Belajar per Hari:")
+    col_h, col_m = st.columns(2)
+    with col_h:
+        target_hours = st.number_input("Hour(s)", min_value=0, max_value=24, value=3, step=1)
+    with col_m:
+        target_minutes_input = st.number_input("Minute(s)", min_value=0, max_value=59, value=30, step=5)
+        
+    minutes_per_day = (target_hours * 60) + target_minutes_input
+    st.info(f"Target: **{target_hours}h {target_minutes_input}m** / day | **{minutes_per_day}m** / day")
+
+    # Target khusus per hari dalam minggu & per tanggal (hari libur, weekend lebih lama, dll)
+    with st.expander("📆 Custom Hari & Tanggal"):
+        st.caption("Kosong = ikut target harian, 0 = hari libur.")
+        weekday_minutes = [
+            st.number_input(
+                f"{name} (min)", min_value=0, max_value=1440, value=None, step=15,
+                placeholder=f"{minutes_per_day}", key=f"weekday_minutes_{i}",
+            )
+            for i, name in enumerate(WEEKDAY_NAMES)
+        ]
+        date_text = st.text_area(
+            "Tanggal Khusus:", height=100, key="date_minutes_text",
+            placeholder="2026-12-25\n2026-12-31 60",
+            help="Satu tanggal per baris: `YYYY-MM-DD menit`. Tanpa menit = libur.",
+        )
+        date_minutes, bad_dates = parse_date_minutes(date_text)
+        if bad_dates:
+            st.warning(f"Baris gak kebaca: {', '.join(bad_dates[:3])}")
+
+    material_editor()
+    generate_step(start_date, end_date, minutes_per_day, weekday_minutes, date_minutes)
+
+    st.markdown("---")
+    show_perf = st.toggle("🛠️ Debug performance", key="perf_debug")
+
+
+# ========== MAIN CONTENT ==========
+st.title("Studico.")
+st.markdown(f"##### Set your Dicoding study schedule automatically.")
+
+tab1, tab2, tab3 = st.tabs(["🗓️ Preview", "📝 Markdown", "📥 Excel"])
+
+with tab1:
+    preview_tab(start_date, minutes_per_day)
+
+with tab2:
+    markdown_tab(start_date)
+
+with tab3:
+    excel_tab(start_date)
+
 # --- FOOTER / WATERMARK ---
 st.markdown("---")
 st.markdown("""
@@ -655,3 +852,26 @@ st.markdown("""
         <small>Created by <b>serafiua</b> | Powered by Streamlit</small>
     </div>
 """, unsafe_allow_html=True)
+
+# --- DEBUG PERFORMANCE (opt-in) ---
+# Durasi stage render sudah termasuk cache hit, jadi angka ini = yang dirasain user.
+# <fmt>_build = durasi build export di worker ExportJobs (tanpa waktu antre), sekali per job.
+perf.record("full_run", time.perf_counter() - run_started)
+perf.widgets_last_run = widget_count()
+if show_perf:
+    with st.sidebar:
+        st.write("### 🛠️ Performance")
+        col_r, col_w = st.columns(2)
+        col_r.metric("Full Reruns", perf.counters["full_run"])
+        col_w.metric("Widgets", perf.widgets_last_run if perf.widgets_last_run is not None else "-")
+        st.dataframe(perf.summary(), hide_index=True, use_container_width=True)
+        # fragment:* = rerun fragment saja (di luar full run)
+        fragment_runs = {name.split(":", 1)[1]: n for name, n in perf.counters.items() if name.startswith("fragment:")}
+        st.caption("Fragment Reruns: " + (" · ".join(f"{name}: {n}x" for name, n in fragment_runs.items()) or "-"))
+        st.download_button(
+            label="📥 Download Perf JSON",
+            data=perf.to_json(),
+            file_name="studico_perf.json",
+            mime="application/json",
+            use_container_width=True,
+        )
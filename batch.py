@@ -0,0 +1,119 @@
+# --- Batch CLI: generate jadwal banyak learner sekaligus ---
+# Contoh manifest (JSON):
+# {
+#   "learners": [
+#     {"name": "budi", "html": ["kelas/python.html"], "start": "2026-01-05",
+#      "end": "2026-02-05", "minutes_per_day": 120},
+#     {"name": "sari", "classes": [{"name": "...", "modules": [...]}], "start": "2026-01-05",
+#      "end": "2026-03-01", "minutes_per_day": 90, "mode": "balanced",
+#      "weekday_minutes": [null, null, null, null, null, 180, 0],
+#      "date_minutes": {"2026-01-20": 0}}
+#   ]
+# }
+# Path HTML relatif terhadap folder manifest. weekday_minutes: 7 item mulai Senin
+# (null = ikut minutes_per_day, 0 = libur); date_minutes: menit untuk tanggal tertentu.
+#
+# Pakai: python batch.py manifest.json --out hasil/ --workers 4
+import argparse
+import datetime
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from catalog import normalize_name
+from exporter import build_excel, export_rows, write_export
+from scheduler import build_tasks, capacity_vector, schedule, schedule_balanced
+from syllabus_cache import parse_cached
+
+
+def _safe_name(name):
+    return re.sub(r'[^\w.-]+', "_", name).strip("_") or "learner"
+
+
+def run_learner(learner, base_dir, out_dir):
+    # Jalan di worker process: parse -> schedule -> tulis Markdown & Excel
+    name = learner["name"]
+    classes = list(learner.get("classes", []))
+    seen = {normalize_name(c["name"]) for c in classes}
+    for html_path in learner.get("html", []):
+        raw = (Path(base_dir) / html_path).read_bytes()
+        result, error = parse_cached(raw)
+        if error:
+            raise ValueError(f"{html_path}: {error}")
+        # Duplikat kelas di-skip, sama seperti di app (nama dibandingkan setelah normalize_name)
+        if normalize_name(result["name"]) not in seen:
+            seen.add(normalize_name(result["name"]))
+            classes.append(result)
+
+    start = datetime.date.fromisoformat(learner["start"])
+    end = datetime.date.fromisoformat(learner["end"])
+    tasks = build_tasks(classes)
+    capacities = None
+    if "weekday_minutes" in learner or "date_minutes" in learner:
+        date_minutes = {
+            datetime.date.fromisoformat(day): int(minutes)
+            for day, minutes in learner.get("date_minutes", {}).items()
+        }
+        capacities = capacity_vector(
+            start, max((end - start).days + 1, 0), int(learner.get("minutes_per_day", 0)),
+            learner.get("weekday_minutes"), date_minutes,
+        )
+    if learner.get("mode", "greedy") == "balanced":
+        plan = schedule_balanced(tasks, start, end, capacities)
+    else:
+        plan = schedule(tasks, start, end, int(learner["minutes_per_day"]), capacities)
+
+    stem = Path(out_dir) / _safe_name(name)
+    # Markdown di-stream per hari langsung ke file
+    with open(stem.with_suffix(".md"), "w", encoding="utf-8") as f:
+        write_export("markdown", plan, f)
+    # Excel juga di-stream: baris dibangun per hari, workbook langsung disimpan ke file
+    if plan.scheduled:
+        build_excel(export_rows(plan), output=stem.with_suffix(".xlsx"))
+    return name, len(tasks), plan.scheduled, plan.is_complete
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate jadwal Studico untuk banyak learner sekaligus.")
+    parser.add_argument("manifest", help="File JSON berisi daftar learner")
+    parser.add_argument("--out", default="studico_output", help="Folder output Markdown/Excel")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Jumlah worker process")
+    args = parser.parse_args(argv)
+
+    manifest_path = Path(args.manifest)
+    with open(manifest_path, encoding="utf-8") as f:
+        learners = json.load(f)["learners"]
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    failed = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(args.workers, 1)) as pool:
+        futures = {
+            pool.submit(run_learner, learner, manifest_path.parent, out_dir): learner.get("name", "?")
+            for learner in learners
+        }
+        # Output ditulis worker begitu learner selesai; di sini cuma laporan progres
+        for future in as_completed(futures):
+            try:
+                name, total, scheduled, complete = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"❌ {futures[future]}: {e}", file=sys.stderr)
+                continue
+            note = "" if complete else f" (waktunya gak cukup: {scheduled}/{total} artikel)"
+            print(f"✅ {name}: {scheduled} artikel dijadwalkan{note}")
+
+    elapsed = time.perf_counter() - started
+    done = len(learners) - failed
+    rate = done / elapsed if elapsed > 0 else 0.0
+    print(f"{done}/{len(learners)} learner selesai dalam {elapsed:.2f}s ({rate:.1f} learner/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# --- Load test: banyak session Studico sekaligus ---
+# Tiap simulated user = satu AppTest (satu session) di proses sendiri: buka app, upload
+# HTML silabus sintetis, tambah artikel di modul, generate, lalu nunggu semua export
+# (Markdown/Excel/CSV/ICS) siap. Semua user di satu level concurrency mulai bareng dan
+# rebutan CPU yang sama; cache silabus di disk & store SQLite juga dipakai bareng.
+# AppTest cuma bisa satu run per proses (Runtime-nya singleton), jadi cache_resource
+# (katalog, pool export) gak dipakai bareng antar session seperti di satu proses server,
+# dan overhead websocket/browser gak ikut terukur.
+# Yang diukur: latency tiap rerun (p50/p99) dan kenaikan RSS per session.
+# Pakai (dari root repo):
+#   python -m benchmarks.load --users 1 2 4 8 --articles 300 --output load.json
+# Exit code 1 kalau ada session yang error / export gak selesai.
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+DEFAULT_USERS = [1, 2, 4, 8]
+EXPORT_BUTTONS = 4   # Markdown, Excel, CSV, ICS
+
+
+def _rss_bytes():
+    # RSS proses sekarang (Linux); fallback ke peak RSS dari getrusage
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _percentile(values, pct):
+    # Nearest-rank, cukup untuk laporan
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class SimulatedUser:
+    def __init__(self, user_id, html, days, export_timeout):
+        from streamlit.testing.v1 import AppTest
+        self.user_id = user_id
+        self.html = html
+        self.days = days
+        self.export_timeout = export_timeout
+        self.at = AppTest.from_file(str(APP_PATH), default_timeout=120)
+        self.reruns = []   # (step, detik)
+
+    def _run(self, step, element=None):
+        # element: widget yang di-set / diklik sebelum rerun (None = rerun biasa)
+        started = time.perf_counter()
+        (element or self.at).run()
+        self.reruns.append((step, time.perf_counter() - started))
+        if self.at.exception:
+            raise RuntimeError(f"{step}: {self.at.exception[0].value}")
+
+    def _button(self, text):
+        return next(b for b in self.at.button if text in b.label)
+
+    def _export_count(self):
+        return len(self.at.get("download_button"))
+
+    def script(self):
+        at = self.at
+        self._run("open")
+        self._run("set_end_date", at.date_input[1].set_value(datetime.date.today() + datetime.timedelta(days=self.days)))
+
+        at.file_uploader[0].set_value((f"kelas_{self.user_id}.html", self.html, "text/html"))
+        self._run("upload", self._button("Process File").click())
+        if not at.session_state.classes:
+            raise RuntimeError("upload: kelas gak ke-parse")
+
+        # Edit modul: tambah artikel ke modul kedua (atau pertama kalau cuma satu)
+        module_idx = min(1, len(at.session_state.classes[0]["modules"]) - 1)
+        self._run("select_module", at.selectbox(key="editor_module").set_value(module_idx))
+        at.text_area(key=f"area_0_{module_idx}").set_value("Latihan Tambahan 15\nQuiz Modul 10")
+        self._run("add_articles", at.button(key="btn_add_art").click())
+
+        self._run("generate", self._button("Generate").click())
+        if at.session_state.schedule is None:
+            raise RuntimeError("generate: jadwal gak kebuat")
+
+        # Export jalan di background; rerun (seperti polling fragment) sampai semua tombol download muncul
+        deadline = time.perf_counter() + self.export_timeout
+        while self._export_count() < EXPORT_BUTTONS:
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"export: cuma {self._export_count()}/{EXPORT_BUTTONS} siap setelah {self.export_timeout}s")
+            time.sleep(0.2)
+            self._run("export_poll")
+        self._run("ics_per_article", at.radio(key="ics_mode").set_value("Per Artikel"))
+
+
+def run_user(user_id, html, days, export_timeout, barrier, results):
+    # Jalan di proses user. Warm-up dulu (import + satu session kecil) supaya RSS awal
+    # = proses server yang sudah jalan, baru mulai bareng user lain.
+    from benchmarks.synthetic import syllabus_html
+    result = {"user": user_id, "reruns": [], "error": None}
+    try:
+        SimulatedUser(-1, syllabus_html(10, seed=10_000 + user_id).encode("utf-8"), days, export_timeout).script()
+        baseline_rss = _rss_bytes()
+        sim = SimulatedUser(user_id, html, days, export_timeout)
+        barrier.wait()
+        result["started"] = time.time()
+        try:
+            sim.script()
+        finally:
+            result["finished"] = time.time()
+            result["reruns"] = sim.reruns
+            # Session masih hidup (AppTest + session_state), jadi selisih RSS = memori session ini
+            result["baseline_rss"] = baseline_rss
+            result["session_rss"] = _rss_bytes() - baseline_rss
+    except Exception as e:
+        result["error"] = f"user {user_id}: {e}"
+        barrier.abort()
+    results.put(result)
+
+
+def run_level(users, articles, days, export_timeout, shared_syllabus):
+    from benchmarks.synthetic import syllabus_html
+
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(users)
+    results = ctx.Queue()
+    # Kelas beda per user (default) = worst case; --shared-syllabus = satu cohort, kelas sama
+    procs = [
+        ctx.Process(
+            target=run_user, name=f"user-{i}",
+            args=(i, syllabus_html(articles, seed=0 if shared_syllabus else i + 1).encode("utf-8"),
+                  days, export_timeout, barrier, results),
+        )
+        for i in range(users)
+    ]
+    for proc in procs:
+        proc.start()
+    collected = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+
+    finished = [r for r in collected if "finished" in r]
+    wall = (max(r["finished"] for r in finished) - min(r["started"] for r in finished)) if finished else 0.0
+    latencies = [seconds for r in collected for _, seconds in r["reruns"]]
+    by_step = {}
+    for r in collected:
+        for step, seconds in r["reruns"]:
+            by_step.setdefault(step, []).append(seconds)
+    session_rss = [r["session_rss"] for r in finished]
+    return {
+        "users": users,
+        "wall_s": wall,
+        "reruns": len(latencies),
+        "reruns_per_s": len(latencies) / wall if wall > 0 else 0.0,
+        "p50_ms": (_percentile(latencies, 50) or 0) * 1000,
+        "p99_ms": (_percentile(latencies, 99) or 0) * 1000,
+        "max_ms": max(latencies, default=0) * 1000,
+        "steps": {
+            step: {"count": len(values), "p50_ms": _percentile(values, 50) * 1000, "p99_ms": _percentile(values, 99) * 1000}
+            for step, values in by_step.items()
+        },
+        "baseline_rss_mb": statistics.median(r["baseline_rss"] for r in finished) / 2**20 if finished else None,
+        "rss_per_session_mb": statistics.median(session_rss) / 2**20 if session_rss else None,
+        "rss_per_session_max_mb": max(session_rss) / 2**20 if session_rss else None,
+        "errors": [r["error"] for r in collected if r["error"]],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test banyak session Studico sekaligus (AppTest).")
+    parser.add_argument("--users", type=int, nargs="+", default=DEFAULT_USERS, help="Level concurrency (jumlah session bareng)")
+    parser.add_argument("--articles", type=int, default=300, help="Jumlah artikel di silabus tiap user")
+    parser.add_argument("--days", type=int, default=60, help="Panjang jadwal (hari dari hari ini)")
+    parser.add_argument("--export-timeout", type=float, default=120, help="Batas nunggu semua export siap (detik)")
+    parser.add_argument("--shared-syllabus", action="store_true", help="Semua user upload kelas yang sama (satu cohort)")
+    parser.add_argument("--output", help="Tulis hasil JSON ke file ini (default: stdout)")
+    args = parser.parse_args(argv)
+
+    levels = []
+    for users in args.users:
+        # Tiap level mulai dari cache silabus & store SQLite kosong
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["STUDICO_STORE_PATH"] = str(Path(tmp) / "load.sqlite3")
+            os.environ["STUDICO_CACHE_DIR"] = str(Path(tmp) / "syllabus-cache")
+            level = run_level(users, args.articles, args.days, args.export_timeout, args.shared_syllabus)
+        levels.append(level)
+        print(f"{users:4d} users: p50 {level['p50_ms']:8.1f} ms  p99 {level['p99_ms']:8.1f} ms"
+              f"  {level['reruns_per_s']:6.1f} reruns/s  {level['rss_per_session_mb'] or 0:6.1f} MB/session"
+              f"{'  ❌ ' + str(len(level['errors'])) + ' error' if level['errors'] else ''}", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "articles": args.articles,
+        "days": args.days,
+        "shared_syllabus": args.shared_syllabus,
+        "levels": levels,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    errors = [e for level in levels for e in level["errors"]]
+    for error in errors[:5]:
+        print(f"❌ {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
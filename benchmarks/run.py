@@ -0,0 +1,89 @@
+# --- Benchmark parser, scheduler & exporter di silabus sintetis ---
+# Pakai (dari root repo):
+#   python -m benchmarks.run --sizes 10 100 1000 10000 100000 --output bench.json
+# Output JSON: satu record per (stage, size) berisi median/min/max detik.
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+
+from benchmarks.synthetic import syllabus_classes, syllabus_html
+from exporter import build_excel, build_markdown, export_rows, render_export
+from scheduler import build_tasks, schedule, schedule_balanced
+from syllabus_parser import parse_dicoding_html
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+START = datetime.date(2026, 1, 5)
+
+
+def _timeit(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return {"median_s": statistics.median(times), "min_s": min(times), "max_s": max(times), "repeat": repeat}
+
+
+def bench_size(n_articles, repeat, minutes_per_day=120):
+    html = syllabus_html(n_articles)
+    classes = syllabus_classes(n_articles)
+    tasks = build_tasks(classes)
+    # Range cukup panjang supaya semua artikel kebagian hari
+    total_minutes = sum(tasks.durations)
+    end = START + datetime.timedelta(days=total_minutes // minutes_per_day + len(tasks))
+    plan = schedule(tasks, START, end, minutes_per_day)
+    rows = list(export_rows(plan))
+
+    stages = {
+        "parse_dicoding_html": lambda: parse_dicoding_html(html),
+        "build_tasks": lambda: build_tasks(classes),
+        "schedule_greedy": lambda: schedule(tasks, START, end, minutes_per_day),
+        "schedule_balanced": lambda: schedule_balanced(tasks, START, end),
+        "markdown": lambda: build_markdown(plan),
+        "excel": lambda: build_excel(rows),
+        "csv": lambda: render_export("csv", plan),
+        "ics": lambda: render_export("ics", plan),
+    }
+    results = []
+    for stage, fn in stages.items():
+        record = {"stage": stage, "size": n_articles}
+        record.update(_timeit(fn, repeat))
+        if stage == "parse_dicoding_html":
+            record["html_bytes"] = len(html.encode("utf-8"))
+        results.append(record)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parser, scheduler dan exporter Studico.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Jumlah artikel per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Berapa kali tiap stage diulang (diambil median)")
+    parser.add_argument("--output", help="Tulis hasil JSON ke file ini (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        for record in bench_size(size, args.repeat):
+            results.append(record)
+            print(f"{record['stage']:<22} {record['size']:>7} artikel  {record['median_s'] * 1000:10.2f} ms", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
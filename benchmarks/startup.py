@@ -0,0 +1,100 @@
+# --- Benchmark cold start & first render app.py ---
+# Tiap sampel jalan di proses Python baru (seperti container yang baru di-scale),
+# lalu cek budget waktu dan library berat yang gak boleh ke-load di render pertama.
+# Pakai (dari root repo):
+#   python -m benchmarks.startup --runs 5 --budget-ms 2500 --output startup.json
+# Exit code 1 kalau budget kelewat atau ada modul terlarang yang ke-import.
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+DEFAULT_FORBIDDEN = ["pandas", "numpy", "openpyxl", "bs4"]
+
+# Dijalankan di subprocess: import streamlit, render pertama, lalu satu rerun
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+first_render = time.perf_counter()
+at.run()
+rerun = time.perf_counter()
+print(json.dumps({{
+    "import_s": imported - started,
+    "first_render_s": first_render - imported,
+    "rerun_s": rerun - first_render,
+    "exception": [str(e.value) for e in at.exception],
+    "loaded": sorted(name for name in {forbidden!r} if name in sys.modules),
+}}))
+"""
+
+
+def probe(forbidden, app_path=APP_PATH):
+    code = PROBE.format(app=str(app_path), forbidden=list(forbidden))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                         cwd=Path(app_path).parent)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark cold start & render pertama Studico.")
+    parser.add_argument("--runs", type=int, default=5, help="Jumlah proses baru yang diukur (diambil median)")
+    parser.add_argument("--budget-ms", type=float, default=2500, help="Budget median import + render pertama (ms)")
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN, help="Modul yang gak boleh ke-load di render pertama")
+    parser.add_argument("--output", help="Tulis hasil JSON ke file ini (default: stdout)")
+    args = parser.parse_args(argv)
+
+    samples = []
+    for i in range(args.runs):
+        sample = probe(args.forbid)
+        samples.append(sample)
+        print(f"run {i + 1}: import {sample['import_s'] * 1000:8.1f} ms  first render {sample['first_render_s'] * 1000:8.1f} ms"
+              f"  rerun {sample['rerun_s'] * 1000:7.1f} ms", file=sys.stderr)
+
+    cold_ms = statistics.median((s["import_s"] + s["first_render_s"]) * 1000 for s in samples)
+    loaded = sorted({name for s in samples for name in s["loaded"]})
+    errors = sorted({e for s in samples for e in s["exception"]})
+    failures = []
+    if cold_ms > args.budget_ms:
+        failures.append(f"cold start {cold_ms:.0f} ms > budget {args.budget_ms:.0f} ms")
+    if loaded:
+        failures.append(f"modul berat ke-load di render pertama: {', '.join(loaded)}")
+    if errors:
+        failures.append(f"app error: {errors[0]}")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "budget_ms": args.budget_ms,
+        "cold_start_median_ms": cold_ms,
+        "first_render_median_ms": statistics.median(s["first_render_s"] * 1000 for s in samples),
+        "rerun_median_ms": statistics.median(s["rerun_s"] * 1000 for s in samples),
+        "forbidden_loaded": loaded,
+        "samples": samples,
+        "failures": failures,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    for failure in failures:
+        print(f"❌ {failure}", file=sys.stderr)
+    if not failures:
+        print(f"✅ cold start {cold_ms:.0f} ms (budget {args.budget_ms:.0f} ms)", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
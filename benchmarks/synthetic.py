@@ -0,0 +1,50 @@
+import random
+
+# --- Generator silabus sintetis ala halaman "Detail Kelas" Dicoding ---
+ARTICLES_PER_MODULE = 25
+
+
+def syllabus_classes(n_articles, n_classes=1, seed=0):
+    # Struktur sama dengan hasil parse_dicoding_html: [{"name", "modules": [{"name", "articles"}]}]
+    rng = random.Random(seed)
+    classes = []
+    per_class = max(n_articles // n_classes, 1)
+    made = 0
+    for c in range(n_classes):
+        count = per_class if c < n_classes - 1 else n_articles - made
+        modules = []
+        for m in range(0, count, ARTICLES_PER_MODULE):
+            articles = [
+                {"title": f"Materi {c + 1}.{m // ARTICLES_PER_MODULE + 1}.{a + 1}", "duration": rng.choice([5, 10, 15, 20, 30, 45, 60, 90])}
+                for a in range(min(ARTICLES_PER_MODULE, count - m))
+            ]
+            modules.append({"name": f"Modul {m // ARTICLES_PER_MODULE + 1}", "articles": articles})
+        classes.append({"name": f"Belajar Sintetis {c + 1}", "modules": modules})
+        made += count
+    return classes
+
+
+def syllabus_html(n_articles, seed=0, noise_kb=256):
+    # Halaman HTML lengkap: head berisi script/style besar, navigasi, silabus, footer
+    class_item = syllabus_classes(n_articles, seed=seed)[0]
+    rng = random.Random(seed)
+    noise = "var __STATE__ = {};" * (noise_kb * 1024 // 19)
+    nav = "".join(f'<li class="nav-item"><a class="nav-link" href="/academies/{i}">Kelas {i}</a></li>' for i in range(200))
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Dicoding</title>",
+        f"<style>{'.x{color:red}' * 2000}</style><script>{noise}</script></head><body>",
+        f'<nav><ul class="navbar-nav">{nav}</ul></nav>',
+        f'<div class="container"><h3 class="mb-3 font-weight-bold">{class_item["name"]}</h3>',
+        '<div class="syllabus">',
+    ]
+    for module in class_item["modules"]:
+        parts.append(f'<div class="syllabus-category"><h5 class="syllabus-category__title">{module["name"]}</h5><ul class="syllabus-module-list">')
+        for art in module["articles"]:
+            if rng.random() < 0.8:
+                title = f'<a href="/academies/1/tutorials/{rng.randint(1, 10**6)}">{art["title"]}</a>'
+            else:
+                title = f'<p class="syllabus-module-list__link">{art["title"]}</p>'
+            parts.append(f'<li class="d-flex">{title}<p class="mb-0 text-secondary">{art["duration"]} menit</p></li>')
+        parts.append("</ul></div>")
+    parts.append(f'</div></div><footer><ul>{nav}</ul></footer><script>{noise}</script></body></html>')
+    return "".join(parts)
@@ -0,0 +1,142 @@
+import csv
+from io import BytesIO, StringIO
+
+import pandas as pd
+
+from catalog import normalize_name
+
+IMPORT_COLUMNS = ["class", "module", "title", "duration"]
+
+# Nama kolom yang diterima (termasuk header Excel hasil export Studico sendiri)
+COLUMN_ALIASES = {
+    "class": "class", "kelas": "class",
+    "module": "module", "modul": "module",
+    "title": "title", "article": "title", "artikel": "title", "judul": "title",
+    "duration": "duration", "duration (min)": "duration", "minutes": "duration", "menit": "duration", "durasi": "duration",
+}
+
+def parse_article_lines(text):
+    # Format `Judul [spasi] Menit` per baris. Sama dengan regex (.+?)\s+(\d+)$,
+    # tapi cukup rsplit + isdecimal (tanpa backtracking regex per baris)
+    articles, error_lines = [], []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        parts = line.rsplit(None, 1)
+        if len(parts) == 2 and parts[1].isdecimal():
+            articles.append({"title": parts[0], "duration": int(parts[1])})
+        else:
+            error_lines.append(line)
+    return articles, error_lines
+
+
+def _normalize_columns(df):
+    renamed = {}
+    for column in df.columns:
+        target = COLUMN_ALIASES.get(str(column).strip().lower())
+        if target and target not in renamed.values():
+            renamed[column] = target
+    df = df.rename(columns=renamed)
+    missing = [c for c in IMPORT_COLUMNS if c not in df.columns]
+    return df, missing
+
+
+def read_pasted(text):
+    # Blok hasil copy dari spreadsheet (tab) atau CSV biasa; header opsional.
+    # attrs["first_line"]: nomor baris data pertama di teks yang di-paste (buat laporan validate)
+    sep = "\t" if "\t" in text else ","
+    df = pd.read_csv(StringIO(text), sep=sep, header=None, dtype=str, keep_default_na=False, skip_blank_lines=True)
+    first_row = [COLUMN_ALIASES.get(str(v).strip().lower()) for v in df.iloc[0]] if len(df) else []
+    if set(IMPORT_COLUMNS) <= set(first_row):
+        df.columns = df.iloc[0]
+        df = df.iloc[1:].reset_index(drop=True)
+        df.attrs["first_line"] = 2
+        return df
+    if df.shape[1] != len(IMPORT_COLUMNS):
+        raise ValueError(f"Butuh {len(IMPORT_COLUMNS)} kolom (class, module, title, duration), ketemu {df.shape[1]}.")
+    df.columns = IMPORT_COLUMNS
+    df.attrs["first_line"] = 1
+    return df
+
+
+def read_file(file_name, raw_bytes):
+    if file_name.lower().endswith((".xlsx", ".xlsm")):
+        return pd.read_excel(BytesIO(raw_bytes), dtype=object)
+    # Delimiter ditebak dari awal file saja, parse-nya tetap pakai engine C
+    sample = raw_bytes[:8192].decode("utf-8-sig", errors="ignore")
+    try:
+        sep = csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+    except csv.Error:
+        sep = ","
+    return pd.read_csv(BytesIO(raw_bytes), sep=sep, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+
+
+def validate(df):
+    # Return (DataFrame valid, nomor baris yang gagal). Semua cek jalan per kolom, sekali pass.
+    # Nomor baris versi spreadsheet: file selalu punya header (data mulai baris 2),
+    # paste tanpa header mulai baris 1 (lihat read_pasted)
+    first_line = df.attrs.get("first_line", 2)
+    df, missing = _normalize_columns(df)
+    if missing:
+        raise ValueError(f"Kolom gak ketemu: {', '.join(missing)}.")
+    df = df[IMPORT_COLUMNS].copy()
+    for column in ("class", "module", "title"):
+        df[column] = df[column].astype("string").str.strip().replace("", pd.NA)
+    # Cell kelas/modul kosong = sama dengan baris di atasnya (mis. merge cell di Excel)
+    df["class"] = df["class"].ffill()
+    df["module"] = df.groupby("class", sort=False)["module"].ffill()
+    df["duration"] = pd.to_numeric(df["duration"], errors="coerce")
+
+    bad = (
+        df["class"].isna() | df["module"].isna() | df["title"].isna()
+        | df["duration"].isna() | (df["duration"] < 0) | (df["duration"] % 1 != 0)
+    )
+    bad_rows = (df.index[bad] + first_line).tolist()
+    valid = df[~bad].astype({"duration": "int64"})
+    return valid, bad_rows
+
+
+def to_classes(df):
+    # Kelompokkan jadi kelas -> modul -> artikel dalam satu pass, urutan kemunculan tetap
+    grouped = {}
+    columns = (df[c].tolist() for c in IMPORT_COLUMNS)
+    for class_name, module_name, title, duration in zip(*columns):
+        modules = grouped.get(class_name)
+        if modules is None:
+            modules = grouped[class_name] = {}
+        articles = modules.get(module_name)
+        if articles is None:
+            articles = modules[module_name] = []
+        articles.append({"title": title, "duration": duration})
+    return [
+        {"name": class_name, "modules": [{"name": name, "articles": articles} for name, articles in modules.items()]}
+        for class_name, modules in grouped.items()
+    ]
+
+
+def merge_classes(existing, imported, own=None):
+    # Kelas / modul yang namanya sudah ada digabung, sisanya ditambahkan utuh.
+    # own(idx): ambil salinan milik session sebelum kelas ke-idx diubah.
+    # Return (kelas baru, kelas yang digabung, jumlah artikel)
+    by_name = {normalize_name(c["name"]): idx for idx, c in enumerate(existing)}
+    added = merged = articles = 0
+    for class_item in imported:
+        articles += sum(len(m["articles"]) for m in class_item["modules"])
+        idx = by_name.get(normalize_name(class_item["name"]))
+        if idx is None:
+            by_name[normalize_name(class_item["name"])] = len(existing)
+            existing.append(class_item)
+            added += 1
+            continue
+        target = own(idx) if own else existing[idx]
+        modules = {normalize_name(m["name"]): m for m in target["modules"]}
+        for module_item in class_item["modules"]:
+            current = modules.get(normalize_name(module_item["name"]))
+            if current is None:
+                modules[normalize_name(module_item["name"])] = module_item
+                target["modules"].append(module_item)
+            else:
+                current["articles"].extend(module_item["articles"])
+        merged += 1
+    return added, merged, articles
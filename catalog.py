@@ -0,0 +1,104 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+
+MAX_CLASSES = 500
+
+_SPACES_RE = re.compile(r'\s+')
+
+
+def normalize_name(name):
+    # "  Belajar   Python " == "belajar python"
+    return _SPACES_RE.sub(" ", str(name)).strip().casefold()
+
+
+class SharedClass(dict):
+    # Kelas dari katalog: dipakai bareng semua session, jangan diubah langsung.
+    # Session yang mau edit ambil salinannya dulu lewat own_copy().
+    pass
+
+
+def own_copy(class_item):
+    return {
+        "name": class_item["name"],
+        "modules": [
+            {"name": m["name"], "articles": [dict(a) for a in m["articles"]]}
+            for m in class_item["modules"]
+        ],
+    }
+
+
+# --- Shared Class Catalog ---
+# Hasil parse silabus disimpan sekali per isi file (key = hash syllabus_cache),
+# session cukup pegang referensinya. Index nama kelas & modul (ternormalisasi)
+# disimpan terurut, jadi cari exact / prefix cukup bisect.
+class ClassCatalog:
+    def __init__(self, max_classes=MAX_CLASSES):
+        self.max_classes = max_classes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> SharedClass (urutan LRU)
+        self._class_index = []          # sorted (nama ternormalisasi, key)
+        self._module_index = []         # sorted (nama ternormalisasi, key, index modul)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def add(self, key, parsed):
+        # Return entri katalog untuk key ini (yang sudah ada dipakai ulang)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+            entry = SharedClass(own_copy(parsed))
+            self._entries[key] = entry
+            self._index(key, entry)
+            while len(self._entries) > self.max_classes:
+                old_key, _ = self._entries.popitem(last=False)
+                self._unindex(old_key)
+            return entry
+
+    def _index(self, key, entry):
+        item = (normalize_name(entry["name"]), key)
+        self._class_index.insert(bisect_left(self._class_index, item), item)
+        for module_idx, module in enumerate(entry["modules"]):
+            item = (normalize_name(module["name"]), key, module_idx)
+            self._module_index.insert(bisect_left(self._module_index, item), item)
+
+    def _unindex(self, key):
+        self._class_index = [item for item in self._class_index if item[1] != key]
+        self._module_index = [item for item in self._module_index if item[1] != key]
+
+    def _prefix_range(self, index, prefix):
+        lo = bisect_left(index, (prefix,))
+        hi = bisect_left(index, (prefix + "\U0010ffff",))
+        return index[lo:hi]
+
+    def find_class(self, name, prefix=False):
+        # Kelas yang namanya sama persis (atau diawali `name` kalau prefix=True)
+        query = normalize_name(name)
+        with self._lock:
+            matches = self._prefix_range(self._class_index, query)
+            if not prefix:
+                matches = [item for item in matches if item[0] == query]
+            return [(key, self._entries[key]) for _, key in matches]
+
+    def find_module(self, name, prefix=False):
+        # (key kelas, kelas, modul) untuk modul yang namanya cocok
+        query = normalize_name(name)
+        with self._lock:
+            matches = self._prefix_range(self._module_index, query)
+            if not prefix:
+                matches = [item for item in matches if item[0] == query]
+            return [(key, self._entries[key], self._entries[key]["modules"][idx]) for _, key, idx in matches]
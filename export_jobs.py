@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from exporter import EXPORT_FORMATS, build_excel, export_rows
+
+# +1: export kecil (Markdown/CSV) gak nunggu di belakang satu Excel besar
+MAX_EXPORT_WORKERS = min((os.cpu_count() or 1) + 1, 4)
+MAX_JOBS = 32
+
+
+def build_export(fmt, schedule, options=(), progress=None):
+    # Bytes file export; progress() dipanggil tiap satu hari selesai ditulis
+    if fmt == "xlsx":
+        return build_excel(export_rows(schedule), progress=progress) if schedule.scheduled else None
+    chunks, _, _ = EXPORT_FORMATS[fmt]
+    buffer = StringIO()
+    for chunk in chunks(schedule, **dict(options)):
+        buffer.write(chunk)
+        if progress:
+            progress()
+    # CSV pakai BOM biar Excel kebaca UTF-8 (emoji & huruf non-ASCII)
+    return buffer.getvalue().encode("utf-8-sig" if fmt == "csv" else "utf-8")
+
+
+class ExportJob:
+    def __init__(self, key, total):
+        self.key = key
+        self.total = max(total, 1)
+        self.done = 0
+        self.started = None
+        self.elapsed = None
+        self.future = None
+
+    def run(self, fmt, schedule, options):
+        # Jalan di thread worker: durasi dihitung sejak build mulai (tanpa waktu antre
+        # di pool) dan sudah terisi sebelum future-nya selesai
+        self.started = time.perf_counter()
+        try:
+            return build_export(fmt, schedule, options, self.tick)
+        finally:
+            self.elapsed = time.perf_counter() - self.started
+
+    def tick(self):
+        # Cuma dipanggil dari thread worker-nya sendiri
+        self.done += 1
+
+    @property
+    def progress(self):
+        return min(self.done / self.total, 1.0)
+
+    @property
+    def ready(self):
+        return self.future.done()
+
+    def result(self):
+        return self.future.result()
+
+
+# --- Export Jobs (pool bersama semua session) ---
+# Build export jalan di thread pool terbatas, bukan di thread script: halaman tetap
+# responsif dan session lain gak antre di belakang satu export besar. Job dengan key
+# yang sama (jadwal + format) dipakai ulang, hasilnya disimpan LRU max MAX_JOBS
+# (job yang masih jalan gak ikut dibuang).
+class ExportJobs:
+    def __init__(self, max_workers=MAX_EXPORT_WORKERS, max_jobs=MAX_JOBS):
+        self.max_jobs = max_jobs
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="studico-export")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, schedule_key, fmt, schedule, options=()):
+        key = (schedule_key, fmt, tuple(options))
+        with self._lock:
+            job = self._jobs.get(key)
+            # Job yang gagal juga dipakai ulang (error-nya yang ditampilkan); build ulang
+            # cuma lewat retry(), bukan tiap rerun
+            if job is not None:
+                self._jobs.move_to_end(key)
+                return job
+            job = ExportJob(key, total=len(schedule.days()) + 1)
+            job.future = self._pool.submit(job.run, fmt, schedule, options)
+            self._jobs[key] = job
+            self._evict()
+            return job
+
+    def retry(self, key):
+        # Buang job yang gagal, jadi submit berikutnya untuk key ini build ulang
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.ready and job.future.exception():
+                del self._jobs[key]
+
+    def _evict(self):
+        # Buang job selesai yang paling lama gak dipakai. Job yang masih jalan tetap
+        # disimpan (walau lewat max_jobs), biar rerun berikutnya gak submit build dobel.
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for key in [key for key, job in self._jobs.items() if job.ready][:excess]:
+            del self._jobs[key]
@@ -0,0 +1,306 @@
+import csv
+import datetime
+from copy import copy
+from functools import lru_cache
+from io import BytesIO, StringIO
+
+# numpy / pandas / openpyxl baru di-import di fungsi yang butuh: export teks
+# (Markdown, CSV, ICS) dan cold start app gak ikut bayar biaya import-nya.
+
+EXCEL_COLUMNS = [
+    "Date",
+    "Class",
+    "Module",
+    "Article",
+    "Duration (min)",
+    "Total Duration (min/day)",
+    "Status (✅)",
+]
+
+
+# --- Shared Styles (dibuat sekali saat Excel pertama dibangun, dipakai semua cell) ---
+@lru_cache(maxsize=None)
+def excel_styles():
+    # Return (border tipis, rata tengah, rata kiri)
+    from openpyxl.styles import Alignment, Border, Side
+    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                         top=Side(style='thin'), bottom=Side(style='thin'))
+    center = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    left = Alignment(horizontal="left", vertical="center", wrap_text=True)
+    return thin_border, center, left
+
+
+# A=Date, B=Class, C=Module, D=Article, E=Duration, F=Total, G=Status
+DAY_MERGE_COLS = (0, 5)     # merge satu blok per hari
+RUN_MERGE_COLS = (1, 2)     # merge per run nilai yang sama di dalam hari
+ARTICLE_COL = 3
+
+
+# --- Streaming Export ---
+# Semua format jalan di atas iter_days: jadwal dilewati sekali, tiap format
+# nge-yield chunk teks per hari. Memori sementara = satu hari, bukan satu tahun.
+def iter_days(schedule):
+    # (tanggal, index task awal, index task akhir, total menit) untuk hari yang ada task-nya
+    days = schedule.days()
+    for offset, start, end, total in zip(days.offsets, days.starts, days.ends, days.totals):
+        yield schedule.date(offset), start, end, total
+
+
+def export_rows(schedule):
+    # Satu baris per artikel, urut per hari (hari kosong gak ada di jadwal sparse)
+    tasks = schedule.tasks
+    for day, start, end, total_minutes_day in iter_days(schedule):
+        date_str = day.strftime("%d-%m-%Y")
+        for idx in range(start, end):
+            yield (date_str, tasks.class_of(idx), tasks.module_of(idx), tasks.titles[idx], tasks.durations[idx], total_minutes_day, "☐")
+
+
+def int_view(values):
+    # array('l') -> numpy tanpa copy
+    import numpy as np
+    return np.frombuffer(values, dtype=f"i{values.itemsize}")
+
+
+def schedule_frame(schedule):
+    # Tabel Excel (satu baris per artikel) langsung dari kolom jadwal: kelas & modul
+    # jadi Categorical dari ID intern, total harian di-repeat dari DayIndex
+    import numpy as np
+    import pandas as pd
+    tasks = schedule.tasks
+    days = schedule.days()
+    n = schedule.scheduled
+    lengths = int_view(days.ends) - int_view(days.starts)
+    day_labels = [schedule.date(offset).strftime("%d-%m-%Y") for offset in days.offsets]
+    day_codes = np.repeat(np.arange(len(days)), lengths)
+    return pd.DataFrame({
+        EXCEL_COLUMNS[0]: pd.Categorical.from_codes(day_codes, categories=pd.Index(day_labels, dtype=object)),
+        EXCEL_COLUMNS[1]: pd.Categorical.from_codes(int_view(tasks.class_ids)[:n], categories=pd.Index(tasks.class_names, dtype=object)),
+        EXCEL_COLUMNS[2]: pd.Categorical.from_codes(int_view(tasks.module_ids)[:n], categories=pd.Index(tasks.module_names, dtype=object)),
+        EXCEL_COLUMNS[3]: pd.Series(tasks.titles[:n], dtype=object),
+        EXCEL_COLUMNS[4]: int_view(tasks.durations)[:n].astype(np.int64, copy=False),
+        EXCEL_COLUMNS[5]: np.repeat(int_view(days.totals), lengths).astype(np.int64, copy=False),
+        EXCEL_COLUMNS[6]: "☐",
+    }, columns=EXCEL_COLUMNS)
+
+
+def markdown_chunks(schedule):
+    # Checklist per hari, siap paste ke Notion
+    tasks = schedule.tasks
+    for day, start, end, total_minutes in iter_days(schedule):
+        parts = [f"- 📅 **{day.strftime('%A, %d %B %Y')}** (Target: {total_minutes} min)\n"]
+        for idx in range(start, end):
+            parts.append(f"    - [ ] **{tasks.class_of(idx)}** | *{tasks.module_of(idx)}* | {tasks.titles[idx]} ({tasks.durations[idx]}m)\n")
+        parts.append("\n")
+        yield "".join(parts)
+
+
+def csv_chunks(schedule):
+    # Kolom sama dengan Excel, tapi tanpa merge: tiap baris lengkap
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXCEL_COLUMNS)
+    rows = export_rows(schedule)
+    for day_rows in _chunks_by_date(rows):
+        writer.writerows(day_rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Jadwal kosong -> tetap ada header
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+ICS_PER_DAY = "day"
+ICS_PER_ARTICLE = "article"
+ICS_DAY_START = datetime.time(8, 0)
+
+
+def _ics_escape(text):
+    return (str(text).replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _ics_line(line):
+    # RFC 5545: baris max 75 octet, lanjutannya diawali spasi (gak motong karakter UTF-8)
+    if len(line.encode("utf-8")) <= 75:
+        return line + "\r\n"
+    parts = []
+    current, size = [], 0
+    for ch in line:
+        width = len(ch.encode("utf-8"))
+        if size + width > (75 if not parts else 74):
+            parts.append("".join(current))
+            current, size = [], 0
+        current.append(ch)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def ics_chunks(schedule, per=ICS_PER_DAY, day_start=ICS_DAY_START, stamp=None):
+    # Event all-day per hari, atau per artikel berurutan mulai jam day_start (waktu lokal)
+    tasks = schedule.tasks
+    stamp = (stamp or datetime.datetime.now(datetime.timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    uid_prefix = schedule.fingerprint()[:16]
+    yield "".join(_ics_line(line) for line in (
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Studico//Study Schedule//ID", "CALSCALE:GREGORIAN",
+    ))
+    for day, start, end, total_minutes in iter_days(schedule):
+        lines = []
+        if per == ICS_PER_DAY:
+            description = "\n".join(
+                f"☐ {tasks.class_of(idx)} | {tasks.module_of(idx)} | {tasks.titles[idx]} ({tasks.durations[idx]}m)"
+                for idx in range(start, end)
+            )
+            lines += [
+                "BEGIN:VEVENT",
+                f"UID:{uid_prefix}-{day:%Y%m%d}@studico",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+                f"DTEND;VALUE=DATE:{day + datetime.timedelta(days=1):%Y%m%d}",
+                f"SUMMARY:{_ics_escape(f'📚 Studico: {end - start} artikel ({total_minutes} min)')}",
+                f"DESCRIPTION:{_ics_escape(description)}",
+                "END:VEVENT",
+            ]
+        else:
+            begin = datetime.datetime.combine(day, day_start)
+            for idx in range(start, end):
+                finish = begin + datetime.timedelta(minutes=tasks.durations[idx])
+                lines += [
+                    "BEGIN:VEVENT",
+                    f"UID:{uid_prefix}-{day:%Y%m%d}-{idx}@studico",
+                    f"DTSTAMP:{stamp}",
+                    f"DTSTART:{begin:%Y%m%dT%H%M%S}",
+                    f"DTEND:{finish:%Y%m%dT%H%M%S}",
+                    f"SUMMARY:{_ics_escape(tasks.titles[idx])}",
+                    f"DESCRIPTION:{_ics_escape(f'{tasks.class_of(idx)} | {tasks.module_of(idx)}')}",
+                    "END:VEVENT",
+                ]
+                begin = finish
+        yield "".join(_ics_line(line) for line in lines)
+    yield _ics_line("END:VCALENDAR")
+
+
+# Format yang bisa dipilih: nama -> (generator chunk, ekstensi file, mime)
+EXPORT_FORMATS = {
+    "markdown": (markdown_chunks, "md", "text/markdown"),
+    "csv": (csv_chunks, "csv", "text/csv"),
+    "ics": (ics_chunks, "ics", "text/calendar"),
+}
+
+
+def write_export(fmt, schedule, fp, **options):
+    # Tulis chunk langsung ke file / buffer tanpa nyimpen hasil lengkap di memori
+    chunks, _, _ = EXPORT_FORMATS[fmt]
+    for chunk in chunks(schedule, **options):
+        fp.write(chunk)
+
+
+def render_export(fmt, schedule, **options):
+    buffer = StringIO()
+    write_export(fmt, schedule, buffer, **options)
+    return buffer.getvalue()
+
+
+def build_markdown(schedule):
+    return render_export("markdown", schedule)
+
+
+def _runs(values, offset):
+    # (start_row, end_row) untuk tiap run nilai yang sama
+    start = 0
+    for i in range(1, len(values) + 1):
+        if i == len(values) or values[i] != values[start]:
+            yield offset + start, offset + i - 1
+            start = i
+
+
+def _chunks_by_date(rows):
+    group = []
+    for r in rows:
+        if group and r[0] != group[0][0]:
+            yield group
+            group = []
+        group.append(r)
+    if group:
+        yield group
+
+
+def _day_merge_ranges(day_rows, row):
+    # Range merge untuk satu hari yang mulai di baris `row`
+    from openpyxl.worksheet.cell_range import CellRange
+    ranges = []
+    end_row = row + len(day_rows) - 1
+    if end_row > row:
+        for col in DAY_MERGE_COLS:
+            ranges.append(CellRange(min_col=col + 1, min_row=row, max_col=col + 1, max_row=end_row))
+    for col in RUN_MERGE_COLS:
+        for start, end in _runs([r[col] for r in day_rows], row):
+            if end > start:
+                ranges.append(CellRange(min_col=col + 1, min_row=start, max_col=col + 1, max_row=end))
+    return ranges
+
+
+def _style_array(ws, alignment):
+    from openpyxl.cell import WriteOnlyCell
+    cell = WriteOnlyCell(ws)
+    cell.border = excel_styles()[0]
+    cell.alignment = alignment
+    return cell._style
+
+
+def build_excel(rows, sheet_name="Schedule", progress=None, output=None):
+    # rows boleh generator: diproses per hari, yang disimpan cuma range merge-nya.
+    # progress(): dipanggil tiap satu hari selesai ditulis (buat progress bar)
+    # output: path / file object tujuan (return None); default return bytes xlsx
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.worksheet.cell_range import MultiCellRange
+
+    # Write-only workbook: baris langsung di-stream ke file, sekali tulis
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+
+    # Style di-resolve sekali ke StyleArray, lalu dicopy ke tiap cell
+    # (assign .border/.alignment per cell = hash + lookup style tiap kali)
+    _, center, left = excel_styles()
+    center_style = _style_array(ws, center)
+    left_style = _style_array(ws, left)
+    col_styles = [left_style if col_idx == ARTICLE_COL else center_style for col_idx in range(len(EXCEL_COLUMNS))]
+
+    header = []
+    for value in EXCEL_COLUMNS:
+        cell = WriteOnlyCell(ws, value=value)
+        cell._style = copy(center_style)
+        header.append(cell)
+    ws.append(header)
+
+    merged = []
+    row_idx = 2
+    for day_rows in _chunks_by_date(rows):
+        day_ranges = _day_merge_ranges(day_rows, row_idx)
+        merged += day_ranges
+        merged_tails = {(r, cr.min_col) for cr in day_ranges for r in range(cr.min_row + 1, cr.max_row + 1)}
+        for values in day_rows:
+            line = []
+            for col_idx, value in enumerate(values):
+                # Cell yang ketutup merge dikosongin, tapi tetap dikasih border
+                if (row_idx, col_idx + 1) in merged_tails:
+                    value = None
+                cell = WriteOnlyCell(ws, value=value)
+                cell._style = copy(col_styles[col_idx])
+                line.append(cell)
+            ws.append(line)
+            row_idx += 1
+        if progress:
+            progress()
+
+    # Sekali assign (MultiCellRange.add cek duplikat O(n) per range)
+    ws.merged_cells = MultiCellRange(merged)
+
+    if output is not None:
+        wb.save(output)
+        return None
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
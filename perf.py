@@ -0,0 +1,81 @@
+import json
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+
+MAX_SAMPLES = 200
+
+
+# --- Perf Log (per session): durasi tiap stage + jumlah rerun ---
+class PerfLog:
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.samples = defaultdict(lambda: deque(maxlen=max_samples))
+        self.counters = Counter()
+        self.widgets_last_run = None
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name, seconds):
+        self.samples[name].append(seconds)
+
+    def count(self, name):
+        self.counters[name] += 1
+
+    def count_fragment(self, name):
+        # Fragment juga jalan di tiap full run; yang dihitung cuma rerun fragment itu sendiri
+        if fragment_rerun():
+            self.count(f"fragment:{name}")
+
+    def summary(self):
+        rows = []
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            rows.append({
+                "stage": name,
+                "calls": len(values),
+                "last_ms": round(values[-1] * 1000, 2),
+                "mean_ms": round(sum(values) / len(values) * 1000, 2),
+                "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2),
+            })
+        return rows
+
+    def to_json(self):
+        return json.dumps({
+            "stages": self.summary(),
+            "samples_ms": {name: [round(v * 1000, 3) for v in values] for name, values in self.samples.items()},
+            "counters": dict(self.counters),
+            "widgets_last_run": self.widgets_last_run,
+        }, indent=2)
+
+
+def widget_count():
+    # Jumlah widget yang dirender di run ini. Pakai state internal Streamlit,
+    # jadi best-effort: None kalau versi Streamlit-nya beda struktur.
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        ids = getattr(getattr(ctx, "shared", None), "widget_ids_this_run", None)
+        if ids is None:
+            ids = getattr(ctx, "widget_ids_this_run", None)
+        if ids is None:
+            return None
+        return len(ids.snapshot()) if hasattr(ids, "snapshot") else len(ids)
+    except Exception:
+        return None
+
+
+def fragment_rerun():
+    # True kalau run ini rerun fragment saja (bukan full run): Streamlit cuma mengisi
+    # fragment_ids_this_run untuk rerun fragment. Best-effort seperti widget_count.
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        return bool(getattr(get_script_run_ctx(), "fragment_ids_this_run", None))
+    except Exception:
+        return False
@@ -0,0 +1,379 @@
+import datetime
+import hashlib
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from dataclasses import dataclass, field
+
+
+# --- Task List (kolom paralel, bukan list of dict) ---
+# Nama kelas & modul di-intern: tiap task cuma simpan ID int, bukan string berulang.
+@dataclass
+class TaskList:
+    class_names: list[str] = field(default_factory=list)
+    module_names: list[str] = field(default_factory=list)
+    class_ids: array = field(default_factory=lambda: array("l"))
+    module_ids: array = field(default_factory=lambda: array("l"))
+    titles: list[str] = field(default_factory=list)
+    durations: array = field(default_factory=lambda: array("l"))
+    _class_index: dict = field(default_factory=dict, repr=False, compare=False)
+    _module_index: dict = field(default_factory=dict, repr=False, compare=False)
+
+    def __len__(self):
+        return len(self.durations)
+
+    def _intern(self, names: list[str], index: dict, name: str) -> int:
+        name_id = index.get(name)
+        if name_id is None:
+            name_id = index[name] = len(names)
+            names.append(name)
+        return name_id
+
+    def append(self, class_name: str, module_name: str, title: str, duration: int):
+        self.class_ids.append(self._intern(self.class_names, self._class_index, class_name))
+        self.module_ids.append(self._intern(self.module_names, self._module_index, module_name))
+        self.titles.append(title)
+        self.durations.append(int(duration))
+
+    def class_of(self, idx: int) -> str:
+        return self.class_names[self.class_ids[idx]]
+
+    def module_of(self, idx: int) -> str:
+        return self.module_names[self.module_ids[idx]]
+
+
+def build_tasks(classes) -> TaskList:
+    # Flatten classes -> modules -> articles sesuai urutan di sidebar
+    tasks = TaskList()
+    for class_item in classes:
+        for module_item in class_item["modules"]:
+            for article in module_item["articles"]:
+                tasks.append(class_item["name"], module_item["name"], article["title"], article["duration"])
+    return tasks
+
+
+# --- Day Index (kolom per hari yang ada task-nya) ---
+# Dihitung sekali per jadwal; Preview, Markdown, Excel & export lain baca dari sini,
+# jadi total menit per hari gak dijumlah ulang di tiap tab.
+@dataclass
+class DayIndex:
+    offsets: array = field(default_factory=lambda: array("l"))   # offset hari (0 = start)
+    starts: array = field(default_factory=lambda: array("l"))    # index task pertama di hari itu
+    ends: array = field(default_factory=lambda: array("l"))      # index task terakhir + 1
+    totals: array = field(default_factory=lambda: array("l"))    # total menit hari itu
+
+    def __len__(self):
+        return len(self.offsets)
+
+
+def index_days(day_offsets, durations) -> DayIndex:
+    days = DayIndex()
+    total = 0
+    for idx, offset in enumerate(day_offsets):
+        if not days.offsets or offset != days.offsets[-1]:
+            if days.offsets:
+                days.ends.append(idx)
+                days.totals.append(total)
+            days.offsets.append(offset)
+            days.starts.append(idx)
+            total = 0
+        total += durations[idx]
+    if days.offsets:
+        days.ends.append(len(day_offsets))
+        days.totals.append(total)
+    return days
+
+
+# --- Schedule Result ---
+@dataclass
+class Schedule:
+    start: datetime.date
+    total_days: int
+    minutes_per_day: int
+    tasks: TaskList
+    # Offset hari (0 = start) untuk setiap task yang berhasil dijadwalkan, urut naik
+    day_offsets: array = field(default_factory=lambda: array("l"))
+    mode: str = "greedy"
+    # Kapasitas menit per hari (panjang total_days); None = semua hari minutes_per_day
+    capacities: array | None = None
+    _days: DayIndex | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def scheduled(self) -> int:
+        return len(self.day_offsets)
+
+    @property
+    def is_complete(self) -> bool:
+        return self.scheduled == len(self.tasks)
+
+    def date(self, offset: int) -> datetime.date:
+        return self.start + datetime.timedelta(days=offset)
+
+    def capacity_vector(self) -> array:
+        if self.capacities is not None:
+            return self.capacities
+        return array("l", [self.minutes_per_day]) * self.total_days
+
+    def days(self) -> DayIndex:
+        # Jadwal gak pernah diubah setelah dibuat (reschedule bikin objek baru), jadi aman di-cache
+        if self._days is None:
+            self._days = index_days(self.day_offsets, self.tasks.durations)
+        return self._days
+
+    def fingerprint(self) -> str:
+        # Hash stabil dari isi jadwal, dipakai sebagai cache key artefak (Markdown/Excel/Preview)
+        digest = hashlib.sha1()
+        digest.update(f"{self.start.isoformat()}|{self.total_days}|{self.minutes_per_day}|{self.mode}".encode())
+        if self.capacities is not None:
+            digest.update(b"capacities:" + self.capacities.tobytes())
+        for column in (self.tasks.durations, self.tasks.class_ids, self.tasks.module_ids, self.day_offsets):
+            digest.update(column.tobytes())
+        for column in (self.tasks.class_names, self.tasks.module_names, self.tasks.titles):
+            digest.update("\x1f".join(column).encode("utf-8"))
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+
+# --- Kapasitas per Hari ---
+def capacity_vector(start: datetime.date, total_days: int, minutes_per_day: int,
+                    weekday_minutes=None, date_minutes=None) -> array:
+    # Menit belajar tiap hari: default minutes_per_day, ditimpa per hari dalam minggu
+    # (list 7 item, 0 = Senin; None = ikut default), lalu per tanggal (dict date -> menit).
+    # Kapasitas <= 0 = hari libur, gak dijadwalkan sama sekali.
+    week = [minutes_per_day if m is None else m for m in (weekday_minutes or [None] * 7)]
+    first = start.weekday()
+    capacities = array("l", (week[(first + d) % 7] for d in range(total_days)))
+    for day, minutes in (date_minutes or {}).items():
+        offset = (day - start).days
+        if 0 <= offset < total_days:
+            capacities[offset] = minutes
+    return capacities
+
+
+def _day_end(prefix, idx: int, capacity: int) -> int:
+    # Index task pertama hari berikutnya, kalau hari ini (kapasitas > 0) mulai dari task idx
+    next_idx = bisect_right(prefix, prefix[idx] + capacity, idx + 1) - 1
+    if prefix[next_idx] == prefix[idx] and next_idx < len(prefix) - 1:
+        # Hari ini masih 0 menit: task berikutnya masuk walau kepanjangan
+        next_idx += 1
+    return next_idx
+
+
+def pack_capacity(durations, capacities, task_idx: int = 0, day: int = 0) -> array:
+    # Greedy per hari: ambil task sebanyak-banyaknya yang muat kapasitas hari itu,
+    # dicari pakai prefix sum + bisect (O(hari * log n), bukan loop per task).
+    # Task yang lebih panjang dari kapasitas harinya ditaruh sendirian (Overload).
+    # task_idx/day: mulai dari awal suatu hari (dipakai reschedule incremental).
+    offsets = array("l")
+    prefix = list(accumulate(durations[task_idx:], initial=0))
+    total_tasks = len(prefix) - 1
+    total_days = len(capacities)
+    idx = 0
+    while idx < total_tasks and day < total_days:
+        capacity = capacities[day]
+        if capacity > 0:
+            next_idx = _day_end(prefix, idx, capacity)
+            offsets.extend(array("l", [day]) * (next_idx - idx))
+            idx = next_idx
+        day += 1
+    return offsets
+
+
+def pack_greedy(durations, total_days: int, minutes_per_day: int, task_idx: int = 0, day: int = 0) -> array:
+    # Greedy dengan target harian yang sama untuk semua hari
+    return pack_capacity(durations, array("l", [minutes_per_day]) * total_days, task_idx, day)
+
+
+def schedule(tasks: TaskList, start: datetime.date, end: datetime.date, minutes_per_day: int,
+             capacities: array | None = None) -> Schedule:
+    total_days = max((end - start).days + 1, 0)
+    if capacities is None:
+        offsets = pack_greedy(tasks.durations, total_days, minutes_per_day)
+    else:
+        offsets = pack_capacity(tasks.durations, capacities)
+    return Schedule(start, total_days, minutes_per_day, tasks, offsets, capacities=capacities)
+
+
+# --- Balanced Mode (urutan tetap, beban harian maksimum seminimal mungkin) ---
+def _fill_days(prefix, capacity: int, total_days: int) -> array:
+    # Isi tiap hari sampai capacity pakai prefix sum + bisect: O(hari * log n), bukan O(n)
+    offsets = array("l")
+    total_tasks = len(prefix) - 1
+    task_idx = 0
+    day = 0
+    while task_idx < total_tasks and day < total_days:
+        next_idx = bisect_right(prefix, prefix[task_idx] + capacity, task_idx + 1) - 1
+        if next_idx == task_idx:
+            break
+        offsets.extend(array("l", [day]) * (next_idx - task_idx))
+        task_idx = next_idx
+        day += 1
+    return offsets
+
+
+def _fits(prefix, capacity: int, total_days: int) -> bool:
+    total_tasks = len(prefix) - 1
+    task_idx = 0
+    for _ in range(total_days):
+        task_idx = bisect_right(prefix, prefix[task_idx] + capacity, task_idx + 1) - 1
+        if task_idx >= total_tasks:
+            return True
+    return total_tasks == 0
+
+
+def min_daily_capacity(durations, total_days: int) -> int | None:
+    # Binary search target harian terkecil supaya semua task (urut) muat di total_days hari
+    if not len(durations):
+        return 0
+    if total_days <= 0:
+        return None
+    prefix = list(accumulate(durations, initial=0))
+    low = max(max(durations), -(-prefix[-1] // total_days))
+    high = max(low, prefix[-1])
+    while low < high:
+        mid = (low + high) // 2
+        if _fits(prefix, mid, total_days):
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+def schedule_balanced(tasks: TaskList, start: datetime.date, end: datetime.date,
+                      capacities: array | None = None) -> Schedule:
+    # minutes_per_day di hasil = target harian paling ketat yang masih feasible.
+    # Dengan capacities, cuma hari yang kapasitasnya > 0 yang dipakai (hari libur dilewati).
+    total_days = max((end - start).days + 1, 0)
+    open_days = [d for d in range(total_days) if capacities is None or capacities[d] > 0]
+    capacity = min_daily_capacity(tasks.durations, len(open_days))
+    if capacity is None:
+        return Schedule(start, total_days, 0, tasks, capacities=capacities)
+    prefix = list(accumulate(tasks.durations, initial=0))
+    offsets = _fill_days(prefix, capacity, len(open_days))
+    if capacities is not None:
+        offsets = array("l", (open_days[o] for o in offsets))
+    return Schedule(start, total_days, capacity, tasks, offsets, mode="balanced", capacities=capacities)
+
+
+# --- Incremental Reschedule ---
+def first_difference(old: TaskList, new: TaskList, limit: int | None = None) -> int:
+    # Index task pertama yang beda (judul, durasi, kelas, atau modul), maksimal `limit`.
+    # Prefix yang identik pasti punya ID intern yang sama, jadi cukup bandingkan ID
+    # plus cek nama di balik ID-nya.
+    same_class = [a == b for a, b in zip(old.class_names, new.class_names)]
+    same_module = [a == b for a, b in zip(old.module_names, new.module_names)]
+    rows = zip(old.titles, new.titles, old.durations, new.durations,
+               old.class_ids, new.class_ids, old.module_ids, new.module_ids)
+    bound = min(len(old), len(new))
+    if limit is not None:
+        bound = min(bound, limit)
+    for idx, (ot, nt, od, nd, oc, nc, om, nm) in enumerate(rows):
+        if idx >= bound:
+            break
+        if ot != nt or od != nd or oc != nc or om != nm or not same_class[oc] or not same_module[om]:
+            return idx
+    return bound
+
+
+def reschedule(prev: Schedule, tasks: TaskList) -> Schedule:
+    # Hitung ulang mulai dari hari pertama yang kena edit; hari-hari sebelumnya dipakai ulang.
+    # Greedy yang mulai dari awal hari cuma bergantung pada task setelahnya, jadi hasilnya
+    # sama persis dengan generate ulang dari nol.
+    if prev.mode == "balanced":
+        # Target harian balanced bergantung ke semua task, jadi dihitung ulang penuh
+        return schedule_balanced(tasks, prev.start, prev.date(prev.total_days - 1), prev.capacities)
+
+    # Lewat task terakhir yang terjadwal, titik mulainya sama saja (hari terakhir)
+    changed = first_difference(prev.tasks, tasks, limit=prev.scheduled)
+    if not prev.scheduled:
+        day = 0
+    else:
+        # Mulai dari hari task terakhir yang gak berubah: sisa kapasitas hari itu
+        # bisa terisi task baru/hasil edit (termasuk task yang dulu gak kebagian hari)
+        day = prev.day_offsets[max(min(changed, prev.scheduled) - 1, 0)]
+    start_idx = bisect_left(prev.day_offsets, day)
+
+    offsets = prev.day_offsets[:start_idx]
+    offsets.extend(pack_capacity(tasks.durations, prev.capacity_vector(), start_idx, day))
+    return Schedule(prev.start, prev.total_days, prev.minutes_per_day, tasks, offsets, capacities=prev.capacities)
+
+
+# --- Feasibility Frontier ---
+# Alternatif kalau waktunya gak cukup: target harian minimal untuk beberapa End Date dan
+# tanggal selesai paling cepat untuk beberapa target harian. Semuanya dari satu prefix sum
+# durasi task (tiap query cukup bisect per hari), bukan generate ulang jadwal penuh.
+MAX_HORIZON_DAYS = 3653   # ~10 tahun, sama dengan batas date_input Streamlit
+
+
+@dataclass
+class Frontier:
+    min_minutes: int | None                # target harian minimal supaya muat sampai End Date
+    earliest_end: datetime.date | None     # selesai paling cepat dengan target sekarang
+    by_end: list                           # [(End Date, target harian minimal | None)]
+    by_target: list                        # [(target harian, selesai paling cepat | None)]
+
+
+def _last_day(prefix, start: datetime.date, minutes_per_day: int, weekday_minutes=None,
+              date_minutes=None, max_days: int = MAX_HORIZON_DAYS) -> int | None:
+    # Offset hari task terakhir kalau dijadwalkan greedy tanpa batas End Date
+    # (kapasitas per hari sama dengan capacity_vector), None kalau lewat max_days
+    total_tasks = len(prefix) - 1
+    if not total_tasks:
+        return 0
+    week = [minutes_per_day if m is None else m for m in (weekday_minutes or [None] * 7)]
+    overrides = {(day - start).days: minutes for day, minutes in (date_minutes or {}).items()}
+    first = start.weekday()
+    idx = 0
+    for day in range(max_days):
+        capacity = overrides.get(day, week[(first + day) % 7])
+        if capacity > 0:
+            idx = _day_end(prefix, idx, capacity)
+            if idx >= total_tasks:
+                return day
+    return None
+
+
+def feasibility_frontier(tasks: TaskList, start: datetime.date, end: datetime.date, minutes_per_day: int,
+                         weekday_minutes=None, date_minutes=None,
+                         extra_days=(7, 14, 30, 60), extra_minutes=(15, 30, 60, 120)) -> Frontier:
+    # Semua angka pakai aturan Greedy yang sama dengan Generate. Target minimal = target
+    # harian terkecil (minimal sepanjang task terpanjang, jadi tanpa Overload) yang selesai
+    # sebelum End Date; hari dengan menit custom tetap pakai menitnya sendiri.
+    prefix = list(accumulate(tasks.durations, initial=0))
+    ends = [end] + [end + datetime.timedelta(days=d) for d in extra_days]
+    horizon = max((day - start).days + 1 for day in ends)
+    last_days = {}
+
+    def fits(minutes, total_days):
+        # Hari terakhir per target dipakai ulang antar End Date (binary search-nya banyak yang sama)
+        if minutes not in last_days:
+            last_days[minutes] = _last_day(prefix, start, minutes, weekday_minutes, date_minutes, horizon)
+        day = last_days[minutes]
+        return day is not None and day < total_days
+
+    def min_target(total_days):
+        if len(prefix) <= 1:
+            return 0
+        low = max(max(tasks.durations), 1)
+        high = max(low, prefix[-1])
+        if not fits(high, total_days):
+            return None
+        while low < high:
+            mid = (low + high) // 2
+            if fits(mid, total_days):
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    by_end = [(day, min_target((day - start).days + 1)) for day in ends]
+    min_minutes = by_end[0][1]
+
+    targets = {minutes_per_day, *(minutes_per_day + m for m in extra_minutes)}
+    if min_minutes:
+        targets.add(min_minutes)
+    by_target = []
+    for minutes in sorted(targets):
+        day = _last_day(prefix, start, minutes, weekday_minutes, date_minutes)
+        by_target.append((minutes, None if day is None else start + datetime.timedelta(days=day)))
+    return Frontier(min_minutes, dict(by_target)[minutes_per_day], by_end, by_target)
@@ -0,0 +1,159 @@
+import datetime
+import json
+import os
+import secrets
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from pathlib import Path
+
+from scheduler import Schedule, build_tasks
+
+STORE_PATH = Path(os.environ.get("STUDICO_STORE_PATH", Path(tempfile.gettempdir()) / "studico-sessions.sqlite3"))
+MAX_AGE_DAYS = 30
+FORMAT_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    plan_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    classes BLOB NOT NULL,
+    schedule_meta TEXT,
+    schedule_offsets BLOB,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS plans_updated_at ON plans (updated_at);
+"""
+
+
+def new_plan_id():
+    return secrets.token_urlsafe(12)
+
+
+# --- Serialisasi ringkas ---
+# Kelas disimpan kolumnar (judul & durasi per modul jadi list), tanpa key dict yang
+# berulang tiap artikel, lalu di-zlib. Jadwal cukup offset hari per task: TaskList-nya
+# dibangun ulang dari kelas saat load.
+def pack_classes(classes):
+    compact = [
+        [c["name"], [[m["name"], [a["title"] for a in m["articles"]], [a["duration"] for a in m["articles"]]]
+                     for m in c["modules"]]]
+        for c in classes
+    ]
+    return zlib.compress(json.dumps(compact, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def unpack_classes(blob):
+    compact = json.loads(zlib.decompress(blob).decode("utf-8"))
+    return [
+        {"name": name, "modules": [
+            {"name": module, "articles": [{"title": t, "duration": d} for t, d in zip(titles, durations)]}
+            for module, titles, durations in modules
+        ]}
+        for name, modules in compact
+    ]
+
+
+def _pack_offsets(offsets):
+    packed = array("q", offsets)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return zlib.compress(packed.tobytes())
+
+
+def _unpack_offsets(blob):
+    packed = array("q")
+    packed.frombytes(zlib.decompress(blob))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return array("l", packed)
+
+
+def _connect(path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5)
+    # WAL: banyak session baca sambil satu nulis tanpa saling nunggu
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def save(plan_id, classes, schedule=None, path=STORE_PATH, max_age_days=MAX_AGE_DAYS):
+    meta = offsets = None
+    if schedule is not None:
+        meta = json.dumps({
+            "start": schedule.start.isoformat(),
+            "total_days": schedule.total_days,
+            "minutes_per_day": schedule.minutes_per_day,
+            "mode": schedule.mode,
+            "capacities": None if schedule.capacities is None else schedule.capacities.tolist(),
+        })
+        offsets = _pack_offsets(schedule.day_offsets)
+    now = time.time()
+    try:
+        conn = _connect(path)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO plans VALUES (?, ?, ?, ?, ?, ?)",
+                    (plan_id, FORMAT_VERSION, pack_classes(classes), meta, offsets, now),
+                )
+                # Plan yang lama gak dibuka ikut dibersihkan
+                conn.execute("DELETE FROM plans WHERE updated_at < ?", (now - max_age_days * 86400,))
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        # Persistence cuma pelengkap, gagal nyimpen bukan error buat user
+        pass
+
+
+def load(plan_id, path=STORE_PATH):
+    # Return (classes, schedule) atau None kalau plan gak ada / gak kebaca
+    try:
+        conn = _connect(path)
+        try:
+            row = conn.execute(
+                "SELECT version, classes, schedule_meta, schedule_offsets FROM plans WHERE plan_id = ?",
+                (plan_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None or row[0] != FORMAT_VERSION:
+        return None
+
+    try:
+        classes = unpack_classes(row[1])
+        plan = None
+        if row[2] is not None:
+            meta = json.loads(row[2])
+            tasks = build_tasks(classes)
+            offsets = _unpack_offsets(row[3])
+            capacities = meta.get("capacities")
+            if capacities is not None:
+                capacities = array("l", capacities)
+            if len(offsets) <= len(tasks):
+                plan = Schedule(
+                    datetime.date.fromisoformat(meta["start"]), meta["total_days"],
+                    meta["minutes_per_day"], tasks, offsets, mode=meta["mode"], capacities=capacities,
+                )
+    except (ValueError, KeyError, TypeError, zlib.error):
+        return None
+    return classes, plan
+
+
+def delete(plan_id, path=STORE_PATH):
+    try:
+        conn = _connect(path)
+        try:
+            with conn:
+                conn.execute("DELETE FROM plans WHERE plan_id = ?", (plan_id,))
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        pass
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from syllabus_parser import PARSER_VERSION, parse_dicoding_html
+
+CACHE_DIR = Path(os.environ.get("STUDICO_CACHE_DIR", Path(tempfile.gettempdir()) / "studico-syllabus-cache"))
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+MAX_PARSE_WORKERS = min(os.cpu_count() or 1, 4)
+_MAIN_LOCK = threading.Lock()
+
+
+def cache_key(raw_bytes):
+    # Hash isi file + versi parser, jadi hasil parser lama otomatis gak kepake lagi
+    digest = hashlib.sha256(f"parser-v{PARSER_VERSION}:".encode())
+    digest.update(raw_bytes)
+    return digest.hexdigest()
+
+
+def load(key, cache_dir=CACHE_DIR):
+    path = Path(cache_dir) / f"{key}.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Update mtime -> dipakai sebagai urutan LRU saat eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return result
+
+
+def store(key, result, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Tulis ke file sementara dulu biar gak ada entri setengah jadi
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_dir / f"{key}.json")
+        evict(cache_dir, max_bytes)
+    except OSError:
+        # Cache cuma optimasi, gagal nulis bukan error buat user
+        pass
+
+
+def evict(cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+    entries = []
+    total = 0
+    for path in Path(cache_dir).glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+
+    # Hapus yang paling lama gak dipakai sampai di bawah batas
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
+
+
+def _parse_bytes(raw_bytes):
+    try:
+        html_content = raw_bytes.decode("utf-8")
+    except UnicodeDecodeError:
+        return None, "File bukan teks UTF-8."
+    return parse_dicoding_html(html_content)
+
+
+def parse_pool(max_workers=MAX_PARSE_WORKERS):
+    # Worker dibuat dari forkserver (atau spawn), bukan fork: fork dari server Streamlit
+    # yang multithread bisa mewarisi lock yang lagi dipegang thread lain (mis. import lock)
+    # dan worker-nya deadlock. Worker baru jalan saat ada job pertama.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+
+
+@contextmanager
+def _plain_main():
+    # Worker forkserver/spawn meng-import ulang modul __main__ parent saat start. Di server
+    # Streamlit itu app.py (script runner memasangnya sebagai __main__), jadi tiap worker
+    # baru bakal ikut menjalankan seluruh halaman. Selama job disubmit (saat worker dibuat),
+    # __main__ diganti modul kosong; dikembalikan hanya kalau belum diganti thread lain.
+    # Lock: dua session yang submit bareng gak saling nyimpen placeholder sebagai "asli".
+    with _MAIN_LOCK:
+        main = sys.modules.get("__main__")
+        placeholder = types.ModuleType("__main__")
+        sys.modules["__main__"] = placeholder
+        try:
+            yield
+        finally:
+            if sys.modules.get("__main__") is placeholder:
+                sys.modules["__main__"] = main
+
+
+def parse_cached(raw_bytes, cache_dir=CACHE_DIR):
+    return parse_many([raw_bytes], cache_dir)[0]
+
+
+def parse_many(raw_files, cache_dir=CACHE_DIR, max_workers=MAX_PARSE_WORKERS, pool=None):
+    # Return list (result, error) sesuai urutan input.
+    # Cache dicek dulu; sisanya di-parse paralel di process pool (pool bersama kalau
+    # dikasih, selain itu pool sementara).
+    keys = [cache_key(raw) for raw in raw_files]
+    results = [None] * len(raw_files)
+    misses = {}
+    for idx, key in enumerate(keys):
+        cached = load(key, cache_dir)
+        if cached is not None:
+            results[idx] = (cached, None)
+        else:
+            # File identik dalam satu batch cukup di-parse sekali
+            misses.setdefault(key, []).append(idx)
+
+    pending = [(key, raw_files[idxs[0]]) for key, idxs in misses.items()]
+    if len(pending) > 1 and pool is not None:
+        with _plain_main():
+            futures = pool.map(_parse_bytes, [raw for _, raw in pending])
+        parsed = list(futures)
+    elif len(pending) > 1 and max_workers > 1:
+        with parse_pool(min(max_workers, len(pending))) as temp_pool:
+            with _plain_main():
+                futures = temp_pool.map(_parse_bytes, [raw for _, raw in pending])
+            parsed = list(futures)
+    else:
+        parsed = [_parse_bytes(raw) for _, raw in pending]
+
+    for (key, _), (result, error) in zip(pending, parsed):
+        if result:
+            store(key, result, cache_dir)
+        for idx in misses[key]:
+            results[idx] = (result, error)
+    return results
@@ -0,0 +1,149 @@
+import re
+
+# Naikkan kalau output parser berubah, biar cache hasil parse yang lama gak kepake
+PARSER_VERSION = 2
+
+DURATION_RE = re.compile(r'(\d+)')
+
+# Blok yang gak pernah berisi silabus tapi bikin file "Save As" jadi beberapa MB
+NOISE_START_RE = re.compile(r'<(script|style)\b|<!--', re.IGNORECASE)
+SYLLABUS_START_RE = re.compile(r'<h[13][\s>]|syllabus-category', re.IGNORECASE)
+HEADING_RE = re.compile(r'<h[13][\s>]', re.IGNORECASE)
+CATEGORY_DIV_RE = re.compile(r'<div\b[^>]*\bclass\s*=\s*["\'][^"\']*\bsyllabus-category(?![\w-])', re.IGNORECASE)
+DIV_TAG_RE = re.compile(r'<(/?)div\b', re.IGNORECASE)
+
+
+def _parse_duration(text):
+    match = DURATION_RE.search(text)
+    return int(match.group(1)) if match else None
+
+
+def _walk_syllabus(soup):
+    # Ambil Nama Kelas
+    class_name_tag = soup.find('h3', class_="mb-3 font-weight-bold")
+    if not class_name_tag:
+        class_name_tag = soup.find('h1')
+
+    class_name = class_name_tag.get_text(strip=True) if class_name_tag else "Dicoding Class"
+
+    # Loop tiap syllabus-category (modul)
+    syllabus_categories = soup.select("div.syllabus-category")
+    if not syllabus_categories:
+        return None
+
+    modules = []
+    for cat in syllabus_categories:
+        modul_title_tag = cat.find("h5", class_="syllabus-category__title")
+        modul_title = modul_title_tag.get_text(strip=True) if modul_title_tag else "Tanpa Modul"
+
+        current_articles = []
+
+        for li in cat.select("li"):
+            judul, menit = None, None
+
+            # Satu find untuk <p> durasi, dipakai di kedua layout (link <a> / <p> biasa)
+            menit_p = li.find("p", class_="mb-0 text-secondary")
+            if menit_p:
+                a_tag = li.find("a")
+                judul = a_tag.get_text(strip=True) if a_tag else None
+
+                if not judul:
+                    judul_p = li.find("p", class_="syllabus-module-list__link")
+                    judul = judul_p.get_text(strip=True) if judul_p else None
+
+                if judul:
+                    menit = _parse_duration(menit_p.get_text(strip=True))
+
+            # Jika berhasil dapet judul dan menit
+            if judul and menit is not None:
+                current_articles.append({"title": judul, "duration": menit})
+
+        # Simpan modul kalo ada artikelnya
+        if current_articles:
+            modules.append({"name": modul_title, "articles": current_articles})
+
+    return {"name": class_name, "modules": modules}
+
+
+def _strip_noise(html_content):
+    # Buang <script>, <style> dan comment pakai str.find (linear, tanpa backtracking regex)
+    lowered = None
+    chunks = []
+    pos = 0
+    while True:
+        match = NOISE_START_RE.search(html_content, pos)
+        if not match:
+            break
+        chunks.append(html_content[pos:match.start()])
+        if match.group(1):
+            if lowered is None:
+                lowered = html_content.lower()
+            end = lowered.find(f"</{match.group(1).lower()}", match.end())
+            end = lowered.find(">", end) if end != -1 else -1
+        else:
+            end = html_content.find("-->", match.end())
+            end = end + 2 if end != -1 else -1
+        if end == -1:
+            pos = len(html_content)
+            break
+        pos = end + 1
+    chunks.append(html_content[pos:])
+    return "".join(chunks)
+
+
+def _syllabus_markup(html_content):
+    # Fast path: buang script/style/comment lalu potong mulai dari judul kelas / silabus,
+    # jadi BeautifulSoup cuma parse bagian yang kepake.
+    markup = _strip_noise(html_content)
+    match = SYLLABUS_START_RE.search(markup)
+    if not match:
+        return None
+    start = max(markup.rfind("<", 0, match.start() + 1), 0)
+    return markup[start:_syllabus_end(markup)]
+
+
+def _syllabus_end(markup):
+    # Cari penutup div syllabus-category terakhir; sisa halaman (footer dll) gak perlu di-parse.
+    # Kalau masih ada <h1>/<h3> setelahnya (judul kelas bisa di situ), jangan dipotong.
+    last_category = None
+    for last_category in CATEGORY_DIV_RE.finditer(markup):
+        pass
+    if last_category is None:
+        return len(markup)
+
+    depth = 0
+    for tag in DIV_TAG_RE.finditer(markup, last_category.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = markup.find(">", tag.end())
+            if end == -1 or HEADING_RE.search(markup, end):
+                return len(markup)
+            return end + 1
+    return len(markup)
+
+
+# --- Parser (From HTML Content) ---
+def parse_dicoding_html(html_content):
+    # bs4 di-import di sini: cache hit (syllabus_cache) & cold start app gak perlu bs4
+    from bs4 import BeautifulSoup
+    try:
+        result = None
+
+        markup = _syllabus_markup(html_content)
+        if markup is not None:
+            result = _walk_syllabus(BeautifulSoup(markup, 'html.parser'))
+
+        # Fallback: DOM walk penuh atas seluruh halaman
+        if result is None:
+            result = _walk_syllabus(BeautifulSoup(html_content, 'html.parser'))
+
+        if result is None:
+            return None, "Tidak menemukan elemen silabus. Pastikan file HTML yang diupload benar (Terdapat halaman silabus)."
+
+        if not result["modules"]:
+            return None, "File HTML terbaca, tapi tidak ada modul/artikel yang ditemukan."
+
+        return result, None
+
+    except Exception as e:
+        return None, f"Error parsing file: {str(e)}"
@@ -0,0 +1,12 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Modul app ada di root repo (flat), bukan package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Test app (AppTest) nulis store session & cache silabus ke folder sementara, bukan punya server
+_tmp = Path(tempfile.mkdtemp(prefix="studico-tests-"))
+os.environ.setdefault("STUDICO_STORE_PATH", str(_tmp / "sessions.sqlite3"))
+os.environ.setdefault("STUDICO_CACHE_DIR", str(_tmp / "syllabus-cache"))
@@ -0,0 +1,45 @@
+# Toast di app.py dirender sebagai HTML: nama kelas (termasuk dari katalog bersama,
+# hasil upload user lain) harus tampil sebagai teks biasa, bukan markup
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+CLASS_NAME = "<b>Kelas</b> & <i>Shared</i>"
+ESCAPED_NAME = "&lt;b&gt;Kelas&lt;/b&gt; &amp; &lt;i&gt;Shared&lt;/i&gt;"
+
+SYLLABUS = (
+    "<html><body><h1>&lt;b&gt;Kelas&lt;/b&gt; &amp; &lt;i&gt;Shared&lt;/i&gt;</h1>"
+    '<div class="syllabus-category"><h5 class="syllabus-category__title">Modul 1</h5><ul>'
+    '<li><a href="#">Pengenalan</a><p class="mb-0 text-secondary">5 menit</p></li>'
+    "</ul></div></body></html>"
+)
+
+
+def toasts(at):
+    return [m.value for m in at.markdown if "custom-toast" in m.value]
+
+
+@pytest.fixture
+def app():
+    return AppTest.from_file(str(APP_PATH), default_timeout=60).run()
+
+
+def test_catalog_class_name_is_escaped(app):
+    at = app
+    at.file_uploader[0].set_value(("kelas.html", SYLLABUS.encode("utf-8"), "text/html"))
+    next(b for b in at.button if "Process File" in b.label).click().run()
+    assert [c["name"] for c in at.session_state.classes] == [CLASS_NAME]
+
+    # Hapus dari list, lalu tambah lagi dari katalog bersama
+    at.button(key="del_class").click().run()
+    at.radio[0].set_value("🗂️ Katalog").run()
+    at.text_input(key="catalog_query").set_value("<b>Kelas").run()
+    at.button(key="add_from_catalog").click().run()
+    assert not at.exception
+
+    messages = toasts(at)
+    assert len(messages) == 1
+    assert f"Berhasil menambahkan kelas {ESCAPED_NAME}" in messages[0]
+    assert "<b>" not in messages[0] and "<i>" not in messages[0]
@@ -0,0 +1,19 @@
+# Nomor baris yang dilaporkan validate harus cocok dengan baris di teks / file aslinya
+from bulk_import import read_file, read_pasted, validate
+
+
+def test_bad_rows_without_header():
+    _, bad_rows = validate(read_pasted("A,M,T,5.0\nA,M,T2,x\nA,M,T3,-1"))
+    assert bad_rows == [2, 3]
+
+
+def test_bad_rows_with_header():
+    _, bad_rows = validate(read_pasted("class\tmodule\ttitle\tduration\nA\tM\tT\t5\nA\tM\tT2\tx"))
+    assert bad_rows == [3]
+
+
+def test_bad_rows_in_file():
+    raw = b"class,module,title,duration\nA,M,T,5\nA,M,,10\n"
+    valid, bad_rows = validate(read_file("kelas.csv", raw))
+    assert bad_rows == [3]
+    assert valid["title"].tolist() == ["T"]
@@ -0,0 +1,58 @@
+# ExportJobs: job yang gagal gak di-build ulang tiap rerun, cuma lewat retry()
+import threading
+
+import export_jobs
+from export_jobs import ExportJobs
+
+
+class FakeSchedule:
+    def days(self):
+        return [None] * 3
+
+
+def test_failed_job_is_kept_until_retry(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def failing_build(fmt, schedule, options=(), progress=None):
+        calls.append(fmt)
+        release.wait(5)
+        raise MemoryError("kebesaran")
+
+    monkeypatch.setattr(export_jobs, "build_export", failing_build)
+    jobs = ExportJobs(max_workers=1)
+    schedule = FakeSchedule()
+
+    job = jobs.submit("key", "xlsx", schedule)
+    release.set()
+    job.future.exception(timeout=5)
+    assert job.ready and isinstance(job.future.exception(), MemoryError)
+
+    # Rerun berikutnya dapat job gagal yang sama, bukan build baru
+    for _ in range(3):
+        assert jobs.submit("key", "xlsx", schedule) is job
+    assert calls == ["xlsx"]
+
+    jobs.retry(job.key)
+    retried = jobs.submit("key", "xlsx", schedule)
+    assert retried is not job
+    retried.future.exception(timeout=5)
+    assert calls == ["xlsx", "xlsx"]
+
+
+def test_retry_keeps_running_and_successful_jobs(monkeypatch):
+    release = threading.Event()
+
+    def slow_build(fmt, schedule, options=(), progress=None):
+        release.wait(5)
+        return b"ok"
+
+    monkeypatch.setattr(export_jobs, "build_export", slow_build)
+    jobs = ExportJobs(max_workers=1)
+    job = jobs.submit("key", "csv", FakeSchedule())
+    jobs.retry(job.key)
+    assert jobs.submit("key", "csv", FakeSchedule()) is job
+    release.set()
+    assert job.result() == b"ok"
+    jobs.retry(job.key)
+    assert jobs.submit("key", "csv", FakeSchedule()) is job
@@ -0,0 +1,68 @@
+# Layout Excel (merge & style) dari build_excel. Exporter pakai internal openpyxl
+# (WriteOnlyCell._style, assign merged_cells di sheet write-only), jadi ini yang
+# nangkep kalau upgrade openpyxl diam-diam ngerusak hasilnya.
+from io import BytesIO
+
+import pytest
+from openpyxl import load_workbook
+
+from exporter import ARTICLE_COL, EXCEL_COLUMNS, build_excel
+
+ROWS = [
+    ("01-01-2026", "Kelas A", "Modul 1", "Artikel 1", 10, 45, "☐"),
+    ("01-01-2026", "Kelas A", "Modul 1", "Artikel 2", 15, 45, "☐"),
+    ("01-01-2026", "Kelas A", "Modul 2", "Artikel 3", 20, 45, "☐"),
+    ("02-01-2026", "Kelas B", "Modul 1", "Artikel 4", 30, 30, "☐"),
+    ("03-01-2026", "Kelas A", "Modul 2", "Artikel 5", 5, 25, "☐"),
+    ("03-01-2026", "Kelas B", "Modul 1", "Artikel 6", 10, 25, "☐"),
+    ("03-01-2026", "Kelas B", "Modul 1", "Artikel 7", 10, 25, "☐"),
+]
+
+# Hari 1 = baris 2-4, hari 2 = baris 5 (satu baris, gak di-merge), hari 3 = baris 6-8
+EXPECTED_MERGES = {
+    "A2:A4", "F2:F4", "B2:B4", "C2:C3",
+    "A6:A8", "F6:F8", "B7:B8", "C7:C8",
+}
+MERGED_TAILS = {"A3", "A4", "F3", "F4", "B3", "B4", "C3", "A7", "A8", "F7", "F8", "B8", "C8"}
+
+
+@pytest.fixture(scope="module")
+def sheet():
+    wb = load_workbook(BytesIO(build_excel(iter(ROWS))))
+    return wb["Schedule"]
+
+
+def test_header(sheet):
+    assert [cell.value for cell in sheet[1]] == EXCEL_COLUMNS
+
+
+def test_merged_ranges(sheet):
+    assert {str(r) for r in sheet.merged_cells.ranges} == EXPECTED_MERGES
+
+
+def test_cell_values(sheet):
+    for row_idx, values in enumerate(ROWS, start=2):
+        for col_idx, value in enumerate(values, start=1):
+            cell = sheet.cell(row=row_idx, column=col_idx)
+            expected = None if cell.coordinate in MERGED_TAILS else value
+            assert cell.value == expected, cell.coordinate
+
+
+def test_cell_styles(sheet):
+    for row in sheet.iter_rows(min_row=1, max_row=len(ROWS) + 1, max_col=len(EXCEL_COLUMNS)):
+        for cell in row:
+            if cell.coordinate in MERGED_TAILS:
+                continue
+            border = cell.border
+            assert {border.left.style, border.right.style, border.top.style, border.bottom.style} == {"thin"}, cell.coordinate
+            horizontal = "left" if cell.row > 1 and cell.column == ARTICLE_COL + 1 else "center"
+            assert cell.alignment.horizontal == horizontal, cell.coordinate
+            assert cell.alignment.vertical == "center", cell.coordinate
+            assert cell.alignment.wrap_text, cell.coordinate
+
+
+def test_output_file_matches_bytes(tmp_path):
+    path = tmp_path / "schedule.xlsx"
+    assert build_excel(iter(ROWS), output=path) is None
+    ws = load_workbook(path)["Schedule"]
+    assert {str(r) for r in ws.merged_cells.ranges} == EXPECTED_MERGES
@@ -0,0 +1,194 @@
+# Scheduler vs implementasi referensi yang sederhana (loop per task / brute force),
+# di input kecil yang diacak. Semua fast path di scheduler.py harus hasilnya sama persis.
+import copy
+import datetime
+import random
+from array import array
+
+import pytest
+
+from scheduler import (
+    TaskList, build_tasks, capacity_vector, feasibility_frontier, index_days, min_daily_capacity,
+    pack_capacity, pack_greedy, reschedule, schedule, schedule_balanced,
+)
+
+START = datetime.date(2026, 1, 5)
+SEEDS = range(5)
+
+
+# --- Referensi ---
+def greedy_loop(durations, capacities):
+    # Loop Greedy versi awal app.py (satu task per iterasi), plus hari kapasitas <= 0 dilewati
+    offsets = []
+    day = used = idx = 0
+    while idx < len(durations) and day < len(capacities):
+        capacity = capacities[day]
+        if capacity <= 0:
+            day += 1
+            continue
+        if durations[idx] <= capacity - used:
+            offsets.append(day)
+            used += durations[idx]
+            idx += 1
+        elif used == 0:
+            # Lebih panjang dari kapasitas: sendirian di harinya (Overload)
+            offsets.append(day)
+            day += 1
+            idx += 1
+        else:
+            day += 1
+            used = 0
+    return offsets
+
+
+def completes(durations, capacities):
+    return len(greedy_loop(durations, capacities)) == len(durations)
+
+
+def brute_min_capacity(durations, total_days):
+    # Beban harian maksimum terkecil kalau urutan task dipotong jadi <= total_days hari
+    if not durations:
+        return 0
+    for capacity in range(max(durations), sum(durations) + 1):
+        days, used = 1, 0
+        for duration in durations:
+            if used + duration > capacity:
+                days, used = days + 1, 0
+            used += duration
+        if days <= total_days:
+            return capacity
+    return None
+
+
+def random_tasks(rng, n):
+    tasks = TaskList()
+    for idx in range(n):
+        tasks.append("Kelas", "Modul", f"Artikel {idx}", rng.choice([0, 0, 1, 5, 10, 20, 30, 60, 200]))
+    return tasks
+
+
+def random_classes(rng):
+    return [
+        {"name": f"Kelas {c}", "modules": [
+            {"name": f"Modul {m}", "articles": [
+                {"title": f"Artikel {a}", "duration": rng.choice([0, 5, 10, 30, 60, 200])}
+                for a in range(rng.randint(0, 6))
+            ]}
+            for m in range(rng.randint(1, 3))
+        ]}
+        for c in range(rng.randint(1, 3))
+    ]
+
+
+def random_edit(rng, classes):
+    # Satu edit seperti di editor: hapus / sisip / ubah durasi artikel, ganti nama / hapus kelas
+    classes = copy.deepcopy(classes)
+    class_item = rng.choice(classes)
+    module = rng.choice(class_item["modules"])
+    op = rng.randrange(5)
+    if op == 0 and module["articles"]:
+        module["articles"].pop(rng.randrange(len(module["articles"])))
+    elif op == 1:
+        module["articles"].insert(rng.randint(0, len(module["articles"])),
+                                  {"title": "Baru", "duration": rng.choice([0, 5, 50, 300])})
+    elif op == 2 and module["articles"]:
+        rng.choice(module["articles"])["duration"] = rng.choice([1, 7, 100])
+    elif op == 3:
+        class_item["name"] += " (rev)"
+    else:
+        classes.remove(class_item)
+    return classes
+
+
+def random_weekdays(rng):
+    return [rng.choice([None, None, 0, 30, 120]) for _ in range(7)] if rng.random() < 0.5 else None
+
+
+# --- Greedy ---
+@pytest.mark.parametrize("seed", SEEDS)
+def test_pack_matches_greedy_loop(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        durations = array("l", random_tasks(rng, rng.randint(0, 30)).durations)
+        total_days = rng.randint(0, 15)
+        minutes = rng.randint(1, 90)
+        assert list(pack_greedy(durations, total_days, minutes)) == greedy_loop(durations, [minutes] * total_days)
+        capacities = array("l", (rng.choice([0, 0, 15, 30, 60, 120]) for _ in range(total_days)))
+        assert list(pack_capacity(durations, capacities)) == greedy_loop(durations, capacities)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_schedule_with_capacities_matches_greedy_loop(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        tasks = random_tasks(rng, rng.randint(0, 20))
+        total_days = rng.randint(1, 20)
+        minutes = rng.randint(10, 90)
+        dates = {START + datetime.timedelta(days=rng.randrange(total_days)): rng.choice([0, 20, 200])}
+        capacities = capacity_vector(START, total_days, minutes, random_weekdays(rng), dates)
+        result = schedule(tasks, START, START + datetime.timedelta(days=total_days - 1), minutes, capacities)
+        assert list(result.day_offsets) == greedy_loop(tasks.durations, capacities)
+
+
+# --- Incremental Reschedule ---
+@pytest.mark.parametrize("seed", SEEDS)
+def test_reschedule_matches_full_regenerate(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        classes = random_classes(rng)
+        total_days = rng.randint(1, 20)
+        end = START + datetime.timedelta(days=total_days - 1)
+        minutes = rng.randint(10, 90)
+        capacities = capacity_vector(START, total_days, minutes, random_weekdays(rng)) if rng.random() < 0.5 else None
+        prev = schedule(build_tasks(classes), START, end, minutes, capacities)
+
+        edited = build_tasks(random_edit(rng, classes))
+        result = reschedule(prev, edited)
+        full = schedule(edited, START, end, minutes, capacities)
+        assert list(result.day_offsets) == list(full.day_offsets)
+        assert list(result.day_offsets) == greedy_loop(edited.durations, full.capacity_vector())
+
+
+# --- Balanced ---
+@pytest.mark.parametrize("seed", SEEDS)
+def test_balanced_matches_brute_force_minimum(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        durations = [rng.randint(0, 40) for _ in range(rng.randint(0, 12))]
+        total_days = rng.randint(1, 6)
+        assert min_daily_capacity(array("l", durations), total_days) == brute_min_capacity(durations, total_days)
+
+        tasks = TaskList()
+        for duration in durations:
+            tasks.append("Kelas", "Modul", "Artikel", duration)
+        result = schedule_balanced(tasks, START, START + datetime.timedelta(days=total_days - 1))
+        assert result.is_complete
+        if durations:
+            assert result.minutes_per_day == brute_min_capacity(durations, total_days)
+            assert max(index_days(result.day_offsets, tasks.durations).totals) <= result.minutes_per_day
+
+
+# --- Feasibility Frontier ---
+@pytest.mark.parametrize("seed", SEEDS)
+def test_frontier_matches_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        tasks = random_tasks(rng, rng.randint(1, 12))
+        total_days = rng.randint(1, 10)
+        minutes = rng.randint(5, 60)
+        weekdays = random_weekdays(rng)
+        dates = {START + datetime.timedelta(days=rng.randint(0, 12)): rng.choice([0, 20]) for _ in range(rng.randint(0, 2))}
+        frontier = feasibility_frontier(tasks, START, START + datetime.timedelta(days=total_days - 1), minutes,
+                                        weekdays, dates, extra_days=(3,), extra_minutes=(15,))
+
+        def fits(target, days):
+            return completes(tasks.durations, capacity_vector(START, days, target, weekdays, dates))
+
+        durations = tasks.durations
+        low = max(max(durations), 1)
+        expected_min = next((m for m in range(low, sum(durations) + low + 1) if fits(m, total_days)), None)
+        assert frontier.min_minutes == expected_min
+
+        expected_days = next((days for days in range(1, 200) if fits(minutes, days)), None)
+        expected_end = START + datetime.timedelta(days=expected_days - 1) if expected_days else None
+        assert frontier.earliest_end == expected_end
@@ -0,0 +1,40 @@
+# Worker parse pool gak boleh meng-import ulang __main__ parent (di server Streamlit = app.py)
+import sys
+import types
+
+import pytest
+
+from benchmarks.synthetic import syllabus_html
+from syllabus_cache import parse_many, parse_pool
+
+
+@pytest.fixture
+def fake_app(tmp_path, monkeypatch):
+    # __main__ palsu seperti yang dipasang script runner Streamlit; kalau worker
+    # menjalankannya, file marker-nya kebuat
+    marker = tmp_path / "imported"
+    script = tmp_path / "fake_app.py"
+    script.write_text(f"open({str(marker)!r}, 'w').close()\n", encoding="utf-8")
+    main = types.ModuleType("__main__")
+    main.__file__ = str(script)
+    monkeypatch.setitem(sys.modules, "__main__", main)
+    return main, marker
+
+
+def test_new_workers_do_not_import_parent_main(tmp_path, fake_app):
+    main, marker = fake_app
+    pages = [syllabus_html(5, seed=seed).encode("utf-8") for seed in (1, 2, 3)]
+    with parse_pool(2) as pool:
+        results = parse_many(pages, cache_dir=tmp_path / "cache", pool=pool)
+    assert all(result and error is None for result, error in results)
+    assert not marker.exists()
+    assert sys.modules["__main__"] is main
+
+
+def test_temporary_pool_does_not_import_parent_main(tmp_path, fake_app):
+    main, marker = fake_app
+    pages = [syllabus_html(5, seed=seed).encode("utf-8") for seed in (4, 5)]
+    results = parse_many(pages, cache_dir=tmp_path / "cache", max_workers=2)
+    assert all(result and error is None for result, error in results)
+    assert not marker.exists()
+    assert sys.modules["__main__"] is main
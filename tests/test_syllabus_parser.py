@@ -0,0 +1,98 @@
+# Parity fast path parse_dicoding_html (potong markup) vs DOM walk penuh seluruh halaman
+import pytest
+from bs4 import BeautifulSoup
+
+from benchmarks.synthetic import syllabus_html
+from syllabus_parser import _walk_syllabus, parse_dicoding_html
+
+
+def full_walk(html):
+    return _walk_syllabus(BeautifulSoup(html, "html.parser"))
+
+
+def assert_parity(html):
+    expected = full_walk(html)
+    result, error = parse_dicoding_html(html)
+    assert error is None
+    assert result == expected
+    return result
+
+
+def category(name, articles, close=True):
+    items = "".join(
+        f'<li><a href="#">{title}</a><p class="mb-0 text-secondary">{minutes} menit</p></li>'
+        for title, minutes in articles
+    )
+    html = f'<div class="syllabus-category"><h5 class="syllabus-category__title">{name}</h5><ul>{items}</ul>'
+    return html + "</div>" if close else html
+
+
+def page(body, head=""):
+    return f"<html><head>{head}</head><body>{body}<footer><p>Footer</p></footer></body></html>"
+
+
+ARTICLES = [("Pengenalan", 5), ("Instalasi", 15)]
+
+
+@pytest.mark.parametrize("n_articles", [1, 10, 100, 1000])
+@pytest.mark.parametrize("seed", [0, 1, 7])
+def test_synthetic_pages(n_articles, seed):
+    result = assert_parity(syllabus_html(n_articles, seed=seed, noise_kb=16))
+    assert sum(len(m["articles"]) for m in result["modules"]) == n_articles
+
+
+@pytest.mark.parametrize("heading", ["<h1>Judul di Bawah</h1>", '<h3 class="mb-3 font-weight-bold">Judul di Bawah</h3>'])
+def test_heading_after_last_category(heading):
+    result = assert_parity(page(category("Modul 1", ARTICLES) + heading))
+    assert result["name"] == "Judul di Bawah"
+
+
+def test_div_inside_script_and_comment_in_category():
+    body = (
+        '<h1>Kelas</h1><div class="syllabus-category"><h5 class="syllabus-category__title">Modul 1</h5>'
+        '<script>var x = "<div><div>";</script><!-- <div class="syllabus-category"> -->'
+        '<ul><li><a href="#">Artikel</a><p class="mb-0 text-secondary">10 menit</p></li></ul></div>'
+        + category("Modul 2", ARTICLES)
+    )
+    result = assert_parity(page(body))
+    assert [m["name"] for m in result["modules"]] == ["Modul 1", "Modul 2"]
+
+
+def test_uppercase_tags_and_single_quoted_class():
+    body = (
+        "<H1>Kelas Besar</H1>"
+        "<DIV class='syllabus-category'><H5 class='syllabus-category__title'>Modul 1</H5><UL>"
+        "<LI><A href='#'>Artikel</A><P class='mb-0 text-secondary'>20 menit</P></LI></UL></DIV>"
+    )
+    result = assert_parity(page(body))
+    assert result["modules"][0]["articles"] == [{"title": "Artikel", "duration": 20}]
+
+
+def test_category_without_closing_div():
+    assert_parity(page("<h1>Kelas</h1>" + category("Modul 1", ARTICLES) + category("Modul 2", ARTICLES, close=False)))
+
+
+def test_paragraph_title_layout():
+    body = (
+        '<h1>Kelas</h1><div class="syllabus-category"><h5 class="syllabus-category__title">Modul 1</h5><ul>'
+        '<li><p class="syllabus-module-list__link">Judul Paragraf</p><p class="mb-0 text-secondary">7 menit</p></li>'
+        "</ul></div>"
+    )
+    result = assert_parity(page(body))
+    assert result["modules"][0]["articles"] == [{"title": "Judul Paragraf", "duration": 7}]
+
+
+def test_page_without_syllabus():
+    html = page("<h1>Bukan Silabus</h1><p>Halo</p>")
+    assert full_walk(html) is None
+    result, error = parse_dicoding_html(html)
+    assert result is None
+    assert error.startswith("Tidak menemukan elemen silabus")
+
+
+def test_syllabus_without_articles():
+    html = page('<h1>Kelas</h1><div class="syllabus-category"><h5 class="syllabus-category__title">Modul 1</h5><ul></ul></div>')
+    assert full_walk(html) == {"name": "Kelas", "modules": []}
+    result, error = parse_dicoding_html(html)
+    assert result is None
+    assert error == "File HTML terbaca, tapi tidak ada modul/artikel yang ditemukan."